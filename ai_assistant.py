@@ -3,42 +3,459 @@ AI assistant module for answering questions about meetings.
 Supports both Claude (Anthropic) and ChatGPT (OpenAI).
 """
 import os
-from anthropic import Anthropic
-from openai import OpenAI
+import re
+import sys
+import json
+import time
+import random
+import asyncio
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+import httpx
+import numpy as np
+
+# orjson parses the model's JSON bodies several times faster when available
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# The anthropic and openai SDKs are imported lazily, only for the provider in use.
+
+# SDK clients shared across AIAssistant instances, keyed by
+# (provider, api_key, http_client), so every instance reuses the same connection pool.
+_CLIENT_CACHE = {}
+
+# HTTP/2 transport shared by all SDK clients
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60
+)
+# Only connecting is tightened; reads keep the SDKs' 600 s default, since a
+# non-streaming 4096-token answer can take minutes to generate
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+_HTTP_CLIENT = None
+
+# SDK-level retries (exponential backoff with jitter on 408/409/429/5xx and connection errors)
+_SDK_MAX_RETRIES = 4
+
+# Async transports are bound to the event loop that created them
+_ASYNC_HTTP_CLIENTS = weakref.WeakKeyDictionary()
+
+
+# Beta header enabling Anthropic prompt caching on cache_control blocks
+_PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# System prompts and instruction templates. The transcript is sent separately as
+# a cacheable prefix, so only the question-specific tail is formatted per call.
+_SYS_ANSWER = """You are an intelligent assistant helping with meeting analysis.
+Your task is to answer questions based on the provided meeting transcript.
+Provide clear, concise, and accurate answers. If the information is not in the transcript,
+clearly state that."""
+
+_TMPL_ANSWER = """{context_prefix}Question: {question}
+
+Please provide a detailed answer based on the meeting transcript."""
+
+_TMPL_ANSWER_MULTI = """Answer each of the following questions based on the meeting transcript.
+Return a JSON object with an "answers" array containing one entry per question, in order,
+each with the question "number" and a detailed "answer".
+
+Questions:
+{questions}"""
+
+_SYS_SUMMARY = "You are an expert at summarizing meetings and extracting key information."
+
+_TMPL_SUMMARY = """Please provide a comprehensive summary of this meeting transcript.
+Include:
+1. Main topics discussed
+2. Key decisions made
+3. Action items (if any)
+4. Important points or takeaways"""
+
+_SYS_INTERVIEW = """You are an expert career coach and interview preparation specialist.
+Provide actionable, specific advice."""
+
+_TMPL_INTERVIEW = """Based on this interview/meeting transcript, please generate:
+
+1. Key questions that were asked
+2. Recommended answers or talking points for each question
+3. Areas that might need more preparation
+4. Overall assessment and tips"""
+
+_SYS_QA_EXTRACT = """You are an expert communicator who excels at formulating
+clear, professional answers to questions. Provide thoughtful, complete responses."""
+
+_TMPL_QA_EXTRACT = """Analyze this meeting/interview transcript and:
+
+1. Identify all questions that were asked
+2. For each question, provide a well-structured, professional answer
+3. If answers were already given in the transcript, improve them
+4. If questions weren't fully answered, provide complete answers
+
+Format the output as:
+Q1: [Question]
+A1: [Detailed Answer]
+
+Q2: [Question]
+A2: [Detailed Answer]"""
+
+_SYS_REPORT = """You are an expert meeting analyst, career coach and communicator.
+Provide clear, actionable, well-structured content."""
+
+_TMPL_REPORT = """Analyze this meeting/interview transcript and return a JSON object with three keys:
+
+"summary": A comprehensive summary including the main topics discussed, key decisions made,
+action items (if any), and important points or takeaways.
+
+"interview_prep": Interview preparation materials including key questions that were asked,
+recommended answers or talking points for each, areas that might need more preparation,
+and an overall assessment with tips.
+
+"qa": Every question that was asked, each with a well-structured, professional answer
+(improve answers already given, complete those that weren't fully answered), formatted as
+Q1: [Question]
+A1: [Detailed Answer]"""
+
+_SYS_STAR = """You are an expert interview coach specializing in STAR method responses.
+Create compelling, structured answers that demonstrate clear problem-solving and results."""
+
+_TMPL_STAR_BULLETS = """Based on this transcript, answer the following question using the STAR format.
+Provide your answer in CONCISE bullet points.
+
+Question: {question}
+
+Format your response as:
+**Situation:**
+- [Key point about the situation]
+- [Additional context if needed]
+
+**Task:**
+- [What needed to be accomplished]
+- [Specific objectives]
+
+**Action:**
+- [Specific action taken]
+- [Steps involved]
+- [Methods used]
+
+**Result:**
+- [Measurable outcome]
+- [Impact achieved]
+
+Provide a brief, focused STAR answer based on the information available."""
+
+_TMPL_STAR_FULL = """Based on this transcript, answer the following question using the STAR format.
+Provide your answer in complete, professional sentences.
+
+Question: {question}
+
+Format your response as:
+**Situation:** [Describe the context and background in 2-3 sentences]
+
+**Task:** [Explain what needed to be accomplished in 1-2 sentences]
+
+**Action:** [Detail the specific actions taken in 2-4 sentences]
+
+**Result:** [Describe the outcome and impact in 2-3 sentences]
+
+Provide a comprehensive STAR answer based on the information available."""
+
+_SYS_QUICK = "Provide concise, focused STAR format answers quickly."
+
+_TMPL_QUICK_BULLETS = """Question: {question}
+
+Based on the transcript excerpt above, provide a brief STAR format answer in bullet points.
+
+Be concise and focus on key points only."""
+
+_TMPL_QUICK_FULL = """Question: {question}
+
+Based on the transcript excerpt above, provide a STAR format answer in 2-3 sentences per section.
+
+Be concise and professional."""
+
+# One STAR section: a bold "**Situation:**"-style header (also "**Situation**:")
+# followed by everything up to the next section header or the end of the response
+_STAR_RE = re.compile(
+    r"^[ \t]*\*\*[ \t]*(situation|task|action|result)\b(?:[^\n*]*\*\*)?[ \t]*:?"
+    r"(.*?)(?=^[ \t]*\*\*[ \t]*(?:situation|task|action|result)\b|\Z)",
+    re.IGNORECASE | re.DOTALL | re.MULTILINE
+)
+
+# Low-variance sampling keeps answers short and repeatable (cacheable)
+_DEFAULT_SAMPLING = {"temperature": 0.2, "top_p": 0.9}
+
+# Per-question answers are a few paragraphs; long documents keep the 2048 default
+_ANSWER_MAX_TOKENS = 512
+
+# interactive_qa flushes streamed text every N fragments or S seconds
+_STREAM_FLUSH_TOKENS = 64
+_STREAM_FLUSH_SECONDS = 0.05
+
+# Embedding retrieval: ~400-token windows with 50-token overlap, top-K per question
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_RETRIEVAL_CHUNK_TOKENS = 400
+_RETRIEVAL_OVERLAP_TOKENS = 50
+_RETRIEVAL_TOP_K = 6
+
+# Rough characters-per-token ratio for prompt budgeting (avoids a tokenizer dependency)
+_CHARS_PER_TOKEN = 4
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Words too common to say anything about which part of a transcript is relevant
+_STOPWORDS = frozenset("""
+a an and are as at be but by can could did do does for from had has have how i if in
+is it its me my of on or our so that the their them then there they this to was we
+were what when where which who why will with would you your
+""".split())
+
+
+def _chunk_transcript(transcript, chunk_chars, overlap_chars=0):
+    """Split a transcript into ~chunk_chars pieces on word boundaries."""
+    chunks = []
+    start = 0
+    length = len(transcript)
+    while start < length:
+        end = min(start + chunk_chars, length)
+        if end < length:
+            space = transcript.rfind(" ", start + 1, end)
+            if space > start:
+                end = space
+        chunks.append(transcript[start:end].strip())
+        if end >= length:
+            break
+        # Step back by the overlap, then realign to the next word
+        start = max(end - overlap_chars, start + 1)
+        space = transcript.find(" ", start, end)
+        start = space + 1 if space != -1 else end
+    return chunks
+
+
+# Structured output for generate_full_report (Claude tool input / OpenAI JSON mode)
+_REPORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {
+            "type": "string",
+            "description": "Meeting summary: main topics, key decisions, action items, takeaways"
+        },
+        "interview_prep": {
+            "type": "string",
+            "description": "Key questions, recommended talking points, areas to prepare, tips"
+        },
+        "qa": {
+            "type": "string",
+            "description": "Every question asked, each with a professional answer, as Q1:/A1: pairs"
+        }
+    },
+    "required": ["summary", "interview_prep", "qa"]
+}
+
+# Structured output for prepare_answers_multi
+_MULTI_ANSWER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "answers": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "number": {"type": "integer", "description": "Question number as listed"},
+                    "answer": {"type": "string", "description": "Detailed answer to the question"}
+                },
+                "required": ["number", "answer"]
+            }
+        }
+    },
+    "required": ["answers"]
+}
+
+# HTTP statuses worth retrying: rate limits, server errors, Anthropic overload
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504, 529}
+
+
+class _RateLimiter:
+    """Token buckets enforcing requests-per-minute and tokens-per-minute budgets."""
+
+    def __init__(self, rpm, tpm):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens):
+        """Wait until one request and the given number of tokens are available."""
+        tokens = min(tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= 1 and self._tokens >= tokens:
+                    self._requests -= 1
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep(1)
+
+
+def _get_http_client():
+    """Return the process-wide HTTP/2 client used by the AI SDKs."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return _HTTP_CLIENT
+
+
+def _prewarm_connection(http_client, base_url):
+    """
+    Open a pooled connection to base_url in a background thread.
+
+    DNS, TCP and TLS are then done before the first real request; the status
+    of the probe is irrelevant and any failure is ignored.
+    """
+    def probe():
+        try:
+            http_client.head(str(base_url), timeout=3)
+        except Exception:
+            pass
+
+    threading.Thread(target=probe, daemon=True).start()
+
+
+def _get_async_http_client():
+    """Return the HTTP/2 async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP_CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        _ASYNC_HTTP_CLIENTS[loop] = client
+    return client
 
 
 class AIAssistant:
     """AI assistant for answering questions based on meeting transcripts."""
 
-    def __init__(self, provider="claude", anthropic_key=None, openai_key=None):
+    # Process-wide instances handed out by shared(), keyed by constructor arguments
+    _INSTANCES = {}
+    _INSTANCES_LOCK = threading.Lock()
+
+    @classmethod
+    def shared(cls, provider="claude", **kwargs):
+        """
+        Return a process-wide AIAssistant for the given provider and options.
+
+        Reusing one instance keeps its SDK clients, connection pool and answer
+        caches warm, so only the first call pays the setup cost.
+
+        Args:
+            provider: "claude" or "chatgpt"
+            **kwargs: Other AIAssistant constructor arguments
+
+        Returns:
+            AIAssistant: The shared instance
+        """
+        key = (provider.lower(), tuple(sorted(kwargs.items())))
+        with cls._INSTANCES_LOCK:
+            instance = cls._INSTANCES.get(key)
+            if instance is None:
+                instance = cls(provider, **kwargs)
+                cls._INSTANCES[key] = instance
+            return instance
+
+    def __init__(self, provider="claude", anthropic_key=None, openai_key=None,
+                 use_retrieval=False, cache_dir=None, http_client=None):
         """
         Initialize the AI assistant.
 
         Args:
             provider: "claude" or "chatgpt"
             anthropic_key: Anthropic API key (for Claude)
-            openai_key: OpenAI API key (for ChatGPT)
+            openai_key: OpenAI API key (for ChatGPT, and embeddings when use_retrieval is set)
+            use_retrieval: Send only the transcript chunks most similar to the question
+                (OpenAI embeddings) instead of the whole transcript for per-question answers
+            cache_dir: Directory for a persistent answer cache (requires diskcache), e.g.
+                "~/.meeting-review/cache". Enabling it forces temperature=0.
+            http_client: httpx.Client to send requests through (e.g. one shared with
+                the Transcriber); defaults to a process-wide HTTP/2 client
         """
         self.provider = provider.lower()
+        self.http_client = http_client or _get_http_client()
+        self.use_retrieval = use_retrieval
+        self.embedding_key = openai_key or os.getenv("OPENAI_API_KEY")
+        if use_retrieval and not self.embedding_key:
+            raise ValueError("OpenAI API key required for retrieval embeddings")
 
         if self.provider == "claude":
             self.anthropic_key = anthropic_key or os.getenv("ANTHROPIC_API_KEY")
             if not self.anthropic_key:
                 raise ValueError("Anthropic API key not provided")
-            self.client = Anthropic(api_key=self.anthropic_key)
+            key = (self.provider, self.anthropic_key, self.http_client)
+            if key not in _CLIENT_CACHE:
+                from anthropic import Anthropic
+                _CLIENT_CACHE[key] = Anthropic(
+                    api_key=self.anthropic_key,
+                    http_client=self.http_client,
+                    max_retries=_SDK_MAX_RETRIES,
+                    timeout=_HTTP_TIMEOUT
+                )
+                _prewarm_connection(self.http_client, _CLIENT_CACHE[key].base_url)
+            self.client = _CLIENT_CACHE[key]
             self.model = "claude-3-5-sonnet-20241022"
 
         elif self.provider == "chatgpt":
             self.openai_key = openai_key or os.getenv("OPENAI_API_KEY")
             if not self.openai_key:
                 raise ValueError("OpenAI API key not provided")
-            self.client = OpenAI(api_key=self.openai_key)
+            key = (self.provider, self.openai_key, self.http_client)
+            if key not in _CLIENT_CACHE:
+                from openai import OpenAI
+                _CLIENT_CACHE[key] = OpenAI(
+                    api_key=self.openai_key,
+                    http_client=self.http_client,
+                    max_retries=_SDK_MAX_RETRIES,
+                    timeout=_HTTP_TIMEOUT
+                )
+                _prewarm_connection(self.http_client, _CLIENT_CACHE[key].base_url)
+            self.client = _CLIENT_CACHE[key]
             self.model = "gpt-4o"
 
         else:
             raise ValueError(f"Unsupported provider: {provider}. Use 'claude' or 'chatgpt'")
 
         self.conversation_history = []
+        self._aclients = weakref.WeakKeyDictionary()
+
+        # LRU of answers keyed by a digest of the full request
+        self.answer_cache_size = 256
+        self._answer_cache = OrderedDict()
+        self._answer_cache_lock = threading.Lock()
+        self._last_transcript_digest = (None, None)
+        self._chunk_cache = (None, None, None)
+        self._retrieval_index = (None, None, None)
+
+        # Optional on-disk layer behind the LRU so answers survive restarts
+        self._disk_cache = None
+        self._sampling = dict(_DEFAULT_SAMPLING)  # passed to every completion call
+        if cache_dir:
+            import diskcache
+            self._disk_cache = diskcache.Cache(os.path.expanduser(cache_dir))
+            self._sampling["temperature"] = 0
+
+        # Token usage reported by the most recent synchronous request
+        self.last_usage = None
 
     def prepare_answer(self, question, transcript, context=None):
         """
@@ -52,52 +469,618 @@ class AIAssistant:
         Returns:
             str: The AI-generated answer
         """
-        # Build the prompt
-        system_prompt = """You are an intelligent assistant helping with meeting analysis.
-Your task is to answer questions based on the provided meeting transcript.
-Provide clear, concise, and accurate answers. If the information is not in the transcript,
-clearly state that."""
+        try:
+            transcript = self._retrieve(question, transcript)
+            return self._ask(*self._answer_prompts(question, transcript, context),
+                             max_tokens=_ANSWER_MAX_TOKENS)
 
-        user_prompt = f"""Meeting Transcript:
-{transcript}
+        except Exception as e:
+            print(f"Error generating answer: {e}")
+            raise
 
-{f"Additional Context: {context}" if context else ""}
+    def _answer_prompts(self, question, transcript, context=None):
+        """Build the (system, user, transcript) prompts for prepare_answer."""
+        context_prefix = f"Additional Context: {context}\n\n" if context else ""
+        user_prompt = _TMPL_ANSWER.format(context_prefix=context_prefix, question=question)
+        return _SYS_ANSWER, user_prompt, self._transcript_block(transcript)
 
-Question: {question}
+    @staticmethod
+    def _transcript_block(transcript, label="Meeting Transcript"):
+        """Format the transcript as the stable, cacheable prefix of a prompt."""
+        return f"{label}:\n{transcript}"
 
-Please provide a detailed answer based on the meeting transcript."""
+    @staticmethod
+    def _claude_messages(user_prompt, transcript=None):
+        """
+        Build Claude messages with the transcript first, marked for prompt caching,
+        so follow-up requests on the same transcript reuse the cached prefix.
+        """
+        if transcript is None:
+            return [{"role": "user", "content": user_prompt}]
+        return [{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": transcript, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": user_prompt}
+            ]
+        }]
+
+    @staticmethod
+    def _chatgpt_messages(system_prompt, user_prompt, transcript=None):
+        """
+        Build ChatGPT messages with the transcript as a stable leading prefix,
+        which OpenAI caches automatically for long prompts.
+        """
+        if transcript is not None:
+            user_prompt = f"{transcript}\n\n{user_prompt}"
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    def _transcript_hash(self, transcript):
+        """Hash a transcript, reusing the previous digest while it is unchanged."""
+        last_transcript, digest = self._last_transcript_digest
+        if transcript != last_transcript:
+            digest = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+            # Stored as one tuple so concurrent callers never see a mismatched pair
+            self._last_transcript_digest = (transcript, digest)
+        return digest
+
+    def _transcript_chunks(self, transcript, chunk_tokens):
+        """
+        Split a transcript into ~chunk_tokens pieces with their word sets.
+
+        The split is cached while the transcript is unchanged, so repeated quick
+        answers during a meeting only chunk the transcript once.
+        """
+        last_transcript, last_chunk_tokens, chunks = self._chunk_cache
+        if transcript != last_transcript or chunk_tokens != last_chunk_tokens:
+            texts = _chunk_transcript(transcript, chunk_tokens * _CHARS_PER_TOKEN)
+            chunks = [(text, set(_WORD_RE.findall(text.lower()))) for text in texts]
+            self._chunk_cache = (transcript, chunk_tokens, chunks)
+        return chunks
+
+    def _relevant_excerpt(self, question, transcript, budget_tokens=750, chunk_tokens=250):
+        """
+        Select the parts of a transcript most relevant to a question within a token budget.
+
+        Chunks are ranked by how many of the question's words they contain, with
+        later chunks winning ties (decisions and action items tend to come late),
+        and are returned in their original order.
+        """
+        if len(transcript) <= budget_tokens * _CHARS_PER_TOKEN:
+            return transcript
+
+        chunks = self._transcript_chunks(transcript, chunk_tokens)
+        question_terms = set(_WORD_RE.findall(question.lower())) - _STOPWORDS
+        ranked = sorted(
+            range(len(chunks)),
+            key=lambda i: (len(question_terms & chunks[i][1]), i),
+            reverse=True
+        )
+
+        selected = []
+        budget_chars = budget_tokens * _CHARS_PER_TOKEN
+        for i in ranked:
+            size = len(chunks[i][0])
+            if size > budget_chars:
+                continue
+            selected.append(i)
+            budget_chars -= size
+
+        return "\n[...]\n".join(chunks[i][0] for i in sorted(selected))
+
+    def _embedding_client(self):
+        """Return the OpenAI client used for embeddings (shared via the client cache)."""
+        key = ("chatgpt", self.embedding_key, self.http_client)
+        if key not in _CLIENT_CACHE:
+            from openai import OpenAI
+            _CLIENT_CACHE[key] = OpenAI(
+                api_key=self.embedding_key,
+                http_client=self.http_client,
+                max_retries=_SDK_MAX_RETRIES,
+                timeout=_HTTP_TIMEOUT
+            )
+        return _CLIENT_CACHE[key]
+
+    def _embed(self, texts):
+        """Embed texts in as few requests as possible; returns unit-norm float32 rows."""
+        client = self._embedding_client()
+        vectors = []
+        for start in range(0, len(texts), 2048):  # API limit on inputs per request
+            response = client.embeddings.create(model=_EMBEDDING_MODEL, input=texts[start:start + 2048])
+            vectors.extend(item.embedding for item in response.data)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        return matrix
+
+    def _retrieve(self, question, transcript, top_k=_RETRIEVAL_TOP_K):
+        """
+        Reduce a transcript to the top_k chunks most similar to the question.
+
+        Chunk embeddings are computed once per transcript (one batched request,
+        made the first time any top_k needs them) and kept on the instance; each
+        question then costs one embedding call and a matrix-vector product.
+        Returns the transcript unchanged when retrieval is disabled or it has no
+        more than top_k chunks.
+        """
+        if not self.use_retrieval:
+            return transcript
+
+        last_transcript, chunks, matrix = self._retrieval_index
+        if transcript != last_transcript:
+            chunks = _chunk_transcript(
+                transcript,
+                _RETRIEVAL_CHUNK_TOKENS * _CHARS_PER_TOKEN,
+                _RETRIEVAL_OVERLAP_TOKENS * _CHARS_PER_TOKEN
+            )
+            matrix = None
+            self._retrieval_index = (transcript, chunks, matrix)
+
+        k = min(top_k, len(chunks))
+        if k == len(chunks):
+            return transcript
+        if matrix is None:
+            # The index may have been built by a call with a larger top_k
+            matrix = self._embed(chunks)
+            self._retrieval_index = (transcript, chunks, matrix)
+
+        scores = matrix @ self._embed([question])[0]
+        top = np.argpartition(-scores, k - 1)[:k]
+        return "\n[...]\n".join(chunks[i] for i in sorted(top))
+
+    async def _retrieve_async(self, question, transcript, top_k=_RETRIEVAL_TOP_K):
+        """_retrieve for async callers; the embedding requests run in the default executor."""
+        if not self.use_retrieval:
+            return transcript
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._retrieve, question, transcript, top_k)
+
+    def _cache_key(self, system_prompt, user_prompt, transcript, max_tokens):
+        """Digest identifying a request by provider, model, prompts and transcript."""
+        transcript_hash = self._transcript_hash(transcript) if transcript is not None else ""
+        parts = (self.provider, self.model, str(max_tokens), system_prompt, user_prompt, transcript_hash)
+        return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key):
+        """Return a memoized answer (memory, then disk), or None on a miss."""
+        with self._answer_cache_lock:
+            answer = self._answer_cache.get(key)
+            if answer is not None:
+                self._answer_cache.move_to_end(key)
+                return answer
+
+        if self._disk_cache is not None:
+            answer = self._disk_cache.get(key)
+            if answer is not None:
+                self._cache_put(key, answer, persist=False)
+        return answer
+
+    def _cache_put(self, key, answer, persist=True):
+        """Memoize an answer, evicting the least recently used entry when full."""
+        with self._answer_cache_lock:
+            self._answer_cache[key] = answer
+            self._answer_cache.move_to_end(key)
+            while len(self._answer_cache) > self.answer_cache_size:
+                self._answer_cache.popitem(last=False)
+
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, answer)
+
+    def _ask(self, system_prompt, user_prompt, transcript=None, max_tokens=2048):
+        """Ask the configured provider for an answer, memoizing identical requests."""
+        key = self._cache_key(system_prompt, user_prompt, transcript, max_tokens)
+        answer = self._cache_get(key)
+        if answer is not None:
+            return answer
+
+        if self.provider == "claude":
+            answer = self._ask_claude(system_prompt, user_prompt, transcript, max_tokens)
+        else:
+            answer = self._ask_chatgpt(system_prompt, user_prompt, transcript, max_tokens)
+
+        self._cache_put(key, answer)
+        return answer
+
+    def _ask_claude(self, system_prompt, user_prompt, transcript=None, max_tokens=2048):
+        """Ask Claude for an answer."""
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            **self._sampling,
+            system=system_prompt,
+            messages=self._claude_messages(user_prompt, transcript),
+            extra_headers=_PROMPT_CACHING_HEADERS if transcript is not None else None
+        )
+        self.last_usage = response.usage
+        return response.content[0].text
+
+    def _ask_chatgpt(self, system_prompt, user_prompt, transcript=None, max_tokens=2048):
+        """Ask ChatGPT for an answer."""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._chatgpt_messages(system_prompt, user_prompt, transcript),
+            max_tokens=max_tokens,
+            **self._sampling
+        )
+        self.last_usage = response.usage
+        return response.choices[0].message.content
+
+    def _stream(self, system_prompt, user_prompt, transcript=None, max_tokens=2048):
+        """
+        Stream an answer from the configured provider.
+
+        Yields:
+            str: Text fragments as they arrive
+        """
+        key = self._cache_key(system_prompt, user_prompt, transcript, max_tokens)
+        answer = self._cache_get(key)
+        if answer is not None:
+            yield answer
+            return
+
+        if self.provider == "claude":
+            fragments = self._stream_claude(system_prompt, user_prompt, transcript, max_tokens)
+        else:
+            fragments = self._stream_chatgpt(system_prompt, user_prompt, transcript, max_tokens)
+
+        parts = []
+        for text in fragments:
+            parts.append(text)
+            yield text
+
+        self._cache_put(key, "".join(parts))
+
+    def _stream_claude(self, system_prompt, user_prompt, transcript=None, max_tokens=2048):
+        """Stream an answer from Claude."""
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            **self._sampling,
+            system=system_prompt,
+            messages=self._claude_messages(user_prompt, transcript),
+            extra_headers=_PROMPT_CACHING_HEADERS if transcript is not None else None
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+            self.last_usage = stream.get_final_message().usage
+
+    def _stream_chatgpt(self, system_prompt, user_prompt, transcript=None, max_tokens=2048):
+        """Stream an answer from ChatGPT."""
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._chatgpt_messages(system_prompt, user_prompt, transcript),
+            max_tokens=max_tokens,
+            **self._sampling,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            elif chunk.usage:
+                # Final chunk: no choices, token accounting only
+                self.last_usage = chunk.usage
+
+    def prepare_answers_batch(self, questions, transcript, use_batch=False,
+                              batch_threshold=10, poll_interval=10):
+        """
+        Answer many questions about one transcript.
+
+        By default the questions run concurrently via asyncio.gather. With
+        use_batch=True, sets of at least batch_threshold questions go through the
+        provider's Batch API instead: half the cost and much higher throughput,
+        but the call blocks until the batch finishes, which can take minutes or
+        up to 24 hours, so it is only for offline jobs.
+
+        Args:
+            questions: List of questions to answer
+            transcript: The meeting transcript
+            use_batch: Opt in to the Batch API for large sets
+            batch_threshold: Minimum number of questions to use the Batch API
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            list: Answers in the same order as questions (None for failed items)
+        """
+        if not questions:
+            return []
+
+        if not use_batch or len(questions) < batch_threshold:
+            async def gather_answers():
+                return await asyncio.gather(
+                    *(self.prepare_answer_async(q, transcript) for q in questions),
+                    return_exceptions=True
+                )
+            # prepare_answer_async has already reported each failure
+            return [None if isinstance(result, BaseException) else result
+                    for result in self._run_async(gather_answers())]
+
+        requests = {
+            f"q{i}": self._answer_prompts(question, transcript)
+            for i, question in enumerate(questions)
+        }
 
         try:
             if self.provider == "claude":
-                return self._ask_claude(system_prompt, user_prompt)
+                results = self._run_claude_batch(requests, poll_interval)
             else:
-                return self._ask_chatgpt(system_prompt, user_prompt)
+                results = self._run_chatgpt_batch(requests, poll_interval)
 
         except Exception as e:
-            print(f"Error generating answer: {e}")
+            print(f"Error running batch: {e}")
             raise
 
-    def _ask_claude(self, system_prompt, user_prompt):
-        """Ask Claude for an answer."""
-        response = self.client.messages.create(
+        return [results.get(f"q{i}") for i in range(len(questions))]
+
+    def prepare_answers_parallel(self, questions, transcript, rpm=40, tpm=16000,
+                                 concurrency=10, max_retries=5):
+        """
+        Answer many questions concurrently while staying under provider rate limits.
+
+        Args:
+            questions: List of questions to answer
+            transcript: The meeting transcript
+            rpm: Requests-per-minute budget
+            tpm: Tokens-per-minute budget (prompt tokens, estimated as chars / 4)
+            concurrency: Maximum number of requests in flight
+            max_retries: Retries for 429/5xx responses, with exponential backoff
+
+        Returns:
+            list: Answers in the same order as questions (None for failed items)
+        """
+        async def answer_all():
+            limiter = _RateLimiter(rpm, tpm)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def answer(question):
+                prompts = self._answer_prompts(question, transcript)
+                tokens = sum(len(part) for part in prompts) // 4
+
+                async with semaphore:
+                    for attempt in range(max_retries + 1):
+                        await limiter.acquire(tokens)
+                        try:
+                            # Retries are done here, through the limiter; none inside the SDK
+                            return await self._ask_async(*prompts, max_tokens=_ANSWER_MAX_TOKENS,
+                                                         max_retries=0)
+                        except Exception as e:
+                            status = getattr(e, "status_code", None)
+                            if status not in _RETRYABLE_STATUS or attempt == max_retries:
+                                raise
+                            await asyncio.sleep(min(60, 2 ** attempt + random.random()))
+
+            return await asyncio.gather(
+                *(answer(q) for q in questions),
+                return_exceptions=True
+            )
+
+        answers = []
+        for question, result in zip(questions, self._run_async(answer_all())):
+            if isinstance(result, BaseException):
+                print(f"Error generating answer for '{question[:60]}': {result}")
+                result = None
+            answers.append(result)
+        return answers
+
+    def prepare_answers_multi(self, questions, transcript, max_per_call=10):
+        """
+        Answer several questions with one request per group of max_per_call.
+
+        The transcript is sent (and billed) once per group instead of once per
+        question, and N questions cost ceil(N / max_per_call) round-trips, which
+        helps when requests-per-minute rather than tokens is the limit.
+
+        Args:
+            questions: List of questions to answer
+            transcript: The meeting transcript
+            max_per_call: Maximum number of questions packed into one request
+
+        Returns:
+            list: Answers in the same order as questions (None if one was missing)
+        """
+        answers = []
+        transcript_block = self._transcript_block(transcript)
+
+        try:
+            for start in range(0, len(questions), max_per_call):
+                group = questions[start:start + max_per_call]
+                numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(group, 1))
+                response = self._ask_json(
+                    _SYS_ANSWER, _TMPL_ANSWER_MULTI.format(questions=numbered),
+                    transcript_block,
+                    schema=_MULTI_ANSWER_SCHEMA,
+                    tool_name="answer_questions",
+                    max_tokens=min(4096, 512 * len(group))
+                )
+
+                by_number = {}
+                for position, item in enumerate(response.get("answers") or [], 1):
+                    if isinstance(item, dict):
+                        by_number[item.get("number", position)] = item.get("answer")
+                    else:
+                        by_number[position] = item
+                answers.extend(by_number.get(i) for i in range(1, len(group) + 1))
+
+            return answers
+
+        except Exception as e:
+            print(f"Error generating answers: {e}")
+            raise
+
+    def _run_claude_batch(self, requests, poll_interval):
+        """Submit requests to the Anthropic Message Batches API and wait for results."""
+        batch = self.client.messages.batches.create(requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": _ANSWER_MAX_TOKENS,
+                    **self._sampling,
+                    "system": system_prompt,
+                    "messages": self._claude_messages(user_prompt, transcript)
+                }
+            }
+            for custom_id, (system_prompt, user_prompt, transcript) in requests.items()
+        ])
+
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = entry.result.message.content[0].text
+            else:
+                print(f"Batch request {entry.custom_id} {entry.result.type}")
+        return results
+
+    def _run_chatgpt_batch(self, requests, poll_interval):
+        """Submit requests to the OpenAI Batch API and wait for results."""
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._chatgpt_messages(system_prompt, user_prompt, transcript),
+                    "max_tokens": _ANSWER_MAX_TOKENS,
+                    **self._sampling
+                }
+            })
+            for custom_id, (system_prompt, user_prompt, transcript) in requests.items()
+        ]
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} finished with status: {batch.status}")
+
+        results = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                item = _json_loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[item["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+                else:
+                    print(f"Batch request {item['custom_id']} failed: {item.get('error')}")
+        return results
+
+    def _run_async(self, coro):
+        """
+        Run coro in a new event loop, closing the loop's clients before it ends.
+
+        Async SDK clients and their HTTP transports are bound to one loop; left
+        open they would keep sockets alive after asyncio.run returns.
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self._close_async_clients()
+        return asyncio.run(runner())
+
+    async def _close_async_clients(self):
+        """Close the async SDK client and HTTP transport of the running event loop."""
+        loop = asyncio.get_running_loop()
+        aclient = self._aclients.pop(loop, None)
+        if aclient is not None:
+            await aclient.close()
+        http_client = _ASYNC_HTTP_CLIENTS.pop(loop, None)
+        if http_client is not None:
+            await http_client.aclose()
+
+    def _get_aclient(self, max_retries=None):
+        """
+        Return the async SDK client bound to the running event loop.
+
+        max_retries, if given, overrides the SDK retries for requests made
+        through the returned client (a copy sharing the same connections).
+        """
+        loop = asyncio.get_running_loop()
+        aclient = self._aclients.get(loop)
+        if aclient is None:
+            if self.provider == "claude":
+                from anthropic import AsyncAnthropic
+                aclient = AsyncAnthropic(
+                    api_key=self.anthropic_key,
+                    http_client=_get_async_http_client(),
+                    max_retries=_SDK_MAX_RETRIES,
+                    timeout=_HTTP_TIMEOUT
+                )
+            else:
+                from openai import AsyncOpenAI
+                aclient = AsyncOpenAI(
+                    api_key=self.openai_key,
+                    http_client=_get_async_http_client(),
+                    max_retries=_SDK_MAX_RETRIES,
+                    timeout=_HTTP_TIMEOUT
+                )
+            self._aclients[loop] = aclient
+        if max_retries is not None:
+            return aclient.with_options(max_retries=max_retries)
+        return aclient
+
+    async def _ask_async(self, system_prompt, user_prompt, transcript=None, max_tokens=2048,
+                         max_retries=None):
+        """
+        Ask the configured provider for an answer without blocking the event loop.
+
+        max_retries overrides the SDK's own retries, for callers that retry
+        (and rate-limit) themselves.
+        """
+        key = self._cache_key(system_prompt, user_prompt, transcript, max_tokens)
+        answer = self._cache_get(key)
+        if answer is not None:
+            return answer
+
+        if self.provider == "claude":
+            answer = await self._ask_claude_async(system_prompt, user_prompt, transcript, max_tokens, max_retries)
+        else:
+            answer = await self._ask_chatgpt_async(system_prompt, user_prompt, transcript, max_tokens, max_retries)
+
+        self._cache_put(key, answer)
+        return answer
+
+    async def _ask_claude_async(self, system_prompt, user_prompt, transcript=None, max_tokens=2048,
+                                max_retries=None):
+        """Ask Claude for an answer (async)."""
+        response = await self._get_aclient(max_retries).messages.create(
             model=self.model,
-            max_tokens=2048,
+            max_tokens=max_tokens,
+            **self._sampling,
             system=system_prompt,
-            messages=[
-                {"role": "user", "content": user_prompt}
-            ]
+            messages=self._claude_messages(user_prompt, transcript),
+            extra_headers=_PROMPT_CACHING_HEADERS if transcript is not None else None
         )
         return response.content[0].text
 
-    def _ask_chatgpt(self, system_prompt, user_prompt):
-        """Ask ChatGPT for an answer."""
-        response = self.client.chat.completions.create(
+    async def _ask_chatgpt_async(self, system_prompt, user_prompt, transcript=None, max_tokens=2048,
+                                 max_retries=None):
+        """Ask ChatGPT for an answer (async)."""
+        response = await self._get_aclient(max_retries).chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=2048
+            messages=self._chatgpt_messages(system_prompt, user_prompt, transcript),
+            max_tokens=max_tokens,
+            **self._sampling
         )
         return response.choices[0].message.content
 
@@ -108,11 +1091,20 @@ Please provide a detailed answer based on the meeting transcript."""
         Args:
             transcript: The meeting transcript
         """
-        print("\n" + "=" * 80)
-        print("INTERACTIVE Q&A SESSION")
-        print("=" * 80)
-        print(f"Using AI Provider: {self.provider.upper()}")
-        print("Ask questions about the meeting. Type 'exit' or 'quit' to end.\n")
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        rule = "-" * 80
+        name = self.provider.upper()
+
+        write("\n".join([
+            "",
+            "=" * 80,
+            "INTERACTIVE Q&A SESSION",
+            "=" * 80,
+            f"Using AI Provider: {name}",
+            "Ask questions about the meeting. Type 'exit' or 'quit' to end.\n\n"
+        ]))
+        flush()
 
         while True:
             question = input("\nYour Question: ").strip()
@@ -125,18 +1117,30 @@ Please provide a detailed answer based on the meeting transcript."""
                 print("Please enter a question.")
                 continue
 
-            print(f"\n[{self.provider.upper()} is thinking...]")
+            write(f"\n[{name} is thinking...]\n\n{name} Answer:\n{rule}\n")
+            flush()
 
             try:
-                answer = self.prepare_answer(question, transcript)
-                print(f"\n{self.provider.upper()} Answer:")
-                print("-" * 80)
-                print(answer)
-                print("-" * 80)
+                # Stream the answer, flushing in small batches rather than per fragment
+                excerpt = self._retrieve(question, transcript)
+                prompts = self._answer_prompts(question, excerpt)
+                pending = []
+                last_flush = time.monotonic()
+                for text in self._stream(*prompts, max_tokens=_ANSWER_MAX_TOKENS):
+                    pending.append(text)
+                    now = time.monotonic()
+                    if len(pending) >= _STREAM_FLUSH_TOKENS or now - last_flush >= _STREAM_FLUSH_SECONDS:
+                        write("".join(pending))
+                        flush()
+                        pending.clear()
+                        last_flush = now
+                pending.append(f"\n{rule}\n")
+                write("".join(pending))
+                flush()
 
             except Exception as e:
-                print(f"\nError: {e}")
-                print("Please try again.")
+                write(f"\nError: {e}\nPlease try again.\n")
+                flush()
 
     def generate_summary(self, transcript):
         """
@@ -148,28 +1152,17 @@ Please provide a detailed answer based on the meeting transcript."""
         Returns:
             str: Meeting summary
         """
-        prompt = """Please provide a comprehensive summary of this meeting transcript.
-Include:
-1. Main topics discussed
-2. Key decisions made
-3. Action items (if any)
-4. Important points or takeaways
-
-Meeting Transcript:
-""" + transcript
-
-        system_prompt = "You are an expert at summarizing meetings and extracting key information."
-
         try:
-            if self.provider == "claude":
-                return self._ask_claude(system_prompt, prompt)
-            else:
-                return self._ask_chatgpt(system_prompt, prompt)
+            return self._ask(*self._summary_prompts(transcript))
 
         except Exception as e:
             print(f"Error generating summary: {e}")
             raise
 
+    def _summary_prompts(self, transcript):
+        """Build the (system, user, transcript) prompts for generate_summary."""
+        return _SYS_SUMMARY, _TMPL_SUMMARY, self._transcript_block(transcript)
+
     def generate_interview_prep(self, transcript):
         """
         Generate interview preparation materials based on the meeting/interview.
@@ -180,29 +1173,20 @@ Meeting Transcript:
         Returns:
             str: Interview preparation guide
         """
-        prompt = """Based on this interview/meeting transcript, please generate:
-
-1. Key questions that were asked
-2. Recommended answers or talking points for each question
-3. Areas that might need more preparation
-4. Overall assessment and tips
-
-Interview/Meeting Transcript:
-""" + transcript
-
-        system_prompt = """You are an expert career coach and interview preparation specialist.
-Provide actionable, specific advice."""
-
         try:
-            if self.provider == "claude":
-                return self._ask_claude(system_prompt, prompt)
-            else:
-                return self._ask_chatgpt(system_prompt, prompt)
+            return self._ask(*self._interview_prep_prompts(transcript))
 
         except Exception as e:
             print(f"Error generating interview prep: {e}")
             raise
 
+    def _interview_prep_prompts(self, transcript):
+        """Build the (system, user, transcript) prompts for generate_interview_prep."""
+        return (
+            _SYS_INTERVIEW, _TMPL_INTERVIEW,
+            self._transcript_block(transcript, "Interview/Meeting Transcript")
+        )
+
     def extract_questions_and_answers(self, transcript):
         """
         Extract questions and generate good answers from a meeting transcript.
@@ -213,36 +1197,86 @@ Provide actionable, specific advice."""
         Returns:
             str: Formatted Q&A document
         """
-        prompt = """Analyze this meeting/interview transcript and:
+        try:
+            return self._ask(*self._qa_prompts(transcript))
 
-1. Identify all questions that were asked
-2. For each question, provide a well-structured, professional answer
-3. If answers were already given in the transcript, improve them
-4. If questions weren't fully answered, provide complete answers
+        except Exception as e:
+            print(f"Error extracting Q&A: {e}")
+            raise
 
-Format the output as:
-Q1: [Question]
-A1: [Detailed Answer]
+    def _qa_prompts(self, transcript):
+        """Build the (system, user, transcript) prompts for extract_questions_and_answers."""
+        return _SYS_QA_EXTRACT, _TMPL_QA_EXTRACT, self._transcript_block(transcript, "Transcript")
 
-Q2: [Question]
-A2: [Detailed Answer]
+    def generate_full_report(self, transcript):
+        """
+        Generate the summary, interview prep and Q&A document in a single request.
 
-Transcript:
-""" + transcript
+        Sends the transcript once instead of three times, which saves two thirds
+        of the transcript input tokens and two network round-trips compared with
+        calling generate_summary, generate_interview_prep and
+        extract_questions_and_answers separately.
 
-        system_prompt = """You are an expert communicator who excels at formulating
-clear, professional answers to questions. Provide thoughtful, complete responses."""
+        Args:
+            transcript: The meeting transcript
 
+        Returns:
+            dict: Contains 'summary', 'interview_prep' and 'qa'
+        """
         try:
-            if self.provider == "claude":
-                return self._ask_claude(system_prompt, prompt)
-            else:
-                return self._ask_chatgpt(system_prompt, prompt)
+            report = self._ask_json(
+                _SYS_REPORT, _TMPL_REPORT,
+                self._transcript_block(transcript),
+                schema=_REPORT_SCHEMA,
+                tool_name="meeting_report",
+                max_tokens=4096
+            )
+            return {key: report.get(key, "") for key in _REPORT_SCHEMA["required"]}
 
         except Exception as e:
-            print(f"Error extracting Q&A: {e}")
+            print(f"Error generating full report: {e}")
             raise
 
+    def _ask_json(self, system_prompt, user_prompt, transcript=None, schema=None,
+                  tool_name="respond", max_tokens=2048):
+        """
+        Ask for a structured JSON response.
+
+        Claude is forced to call a tool whose input_schema is the given schema;
+        ChatGPT uses JSON mode.
+
+        Returns:
+            dict: The parsed JSON object
+        """
+        if self.provider == "claude":
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                **self._sampling,
+                system=system_prompt,
+                messages=self._claude_messages(user_prompt, transcript),
+                tools=[{
+                    "name": tool_name,
+                    "description": "Return the requested content as structured data.",
+                    "input_schema": schema
+                }],
+                tool_choice={"type": "tool", "name": tool_name},
+                extra_headers=_PROMPT_CACHING_HEADERS if transcript is not None else None
+            )
+            for block in response.content:
+                if block.type == "tool_use":
+                    return block.input
+            raise ValueError("Claude did not return structured output")
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._chatgpt_messages(system_prompt, user_prompt, transcript),
+            max_tokens=max_tokens,
+            **self._sampling,
+            response_format={"type": "json_object"}
+        )
+        return _json_loads(response.choices[0].message.content)
+
     def generate_star_answer(self, question, transcript, format_type="full"):
         """
         Generate an answer in STAR format (Situation, Task, Action, Result).
@@ -255,122 +1289,34 @@ clear, professional answers to questions. Provide thoughtful, complete responses
         Returns:
             dict: STAR formatted answer with components
         """
-        if format_type == "bullets":
-            prompt = f"""Based on this transcript, answer the following question using the STAR format.
-Provide your answer in CONCISE bullet points.
-
-Question: {question}
-
-Format your response as:
-**Situation:**
-- [Key point about the situation]
-- [Additional context if needed]
-
-**Task:**
-- [What needed to be accomplished]
-- [Specific objectives]
-
-**Action:**
-- [Specific action taken]
-- [Steps involved]
-- [Methods used]
-
-**Result:**
-- [Measurable outcome]
-- [Impact achieved]
-
-Transcript:
-{transcript}
-
-Provide a brief, focused STAR answer based on the information available."""
-
-        else:  # full format
-            prompt = f"""Based on this transcript, answer the following question using the STAR format.
-Provide your answer in complete, professional sentences.
-
-Question: {question}
-
-Format your response as:
-**Situation:** [Describe the context and background in 2-3 sentences]
-
-**Task:** [Explain what needed to be accomplished in 1-2 sentences]
-
-**Action:** [Detail the specific actions taken in 2-4 sentences]
-
-**Result:** [Describe the outcome and impact in 2-3 sentences]
-
-Transcript:
-{transcript}
-
-Provide a comprehensive STAR answer based on the information available."""
-
-        system_prompt = """You are an expert interview coach specializing in STAR method responses.
-Create compelling, structured answers that demonstrate clear problem-solving and results."""
-
         try:
-            if self.provider == "claude":
-                response = self._ask_claude(system_prompt, prompt)
-            else:
-                response = self._ask_chatgpt(system_prompt, prompt)
-
-            # Parse the response into components
-            components = self._parse_star_response(response)
-            return {
-                "full_response": response,
-                "components": components,
-                "format_type": format_type
-            }
+            transcript = self._retrieve(question, transcript)
+            response = self._ask(*self._star_prompts(question, transcript, format_type))
+            return self._star_result(response, format_type)
 
         except Exception as e:
             print(f"Error generating STAR answer: {e}")
             raise
 
-    def _parse_star_response(self, response):
-        """Parse STAR response into components."""
-        components = {
-            "situation": "",
-            "task": "",
-            "action": "",
-            "result": ""
+    def _star_prompts(self, question, transcript, format_type):
+        """Build the (system, user, transcript) prompts for generate_star_answer."""
+        template = _TMPL_STAR_BULLETS if format_type == "bullets" else _TMPL_STAR_FULL
+        prompt = template.format(question=question)
+        return _SYS_STAR, prompt, self._transcript_block(transcript, "Transcript")
+
+    def _star_result(self, response, format_type):
+        """Package a STAR response with its parsed components."""
+        return {
+            "full_response": response,
+            "components": self._parse_star_response(response),
+            "format_type": format_type
         }
 
-        lines = response.split("\n")
-        current_section = None
-
-        for line in lines:
-            line_lower = line.lower().strip()
-            if line_lower.startswith("**situation"):
-                current_section = "situation"
-                # Extract content after the header if present
-                if ":" in line:
-                    content = line.split(":", 1)[1].strip()
-                    if content and not content.startswith("**"):
-                        components[current_section] += content + "\n"
-            elif line_lower.startswith("**task"):
-                current_section = "task"
-                if ":" in line:
-                    content = line.split(":", 1)[1].strip()
-                    if content and not content.startswith("**"):
-                        components[current_section] += content + "\n"
-            elif line_lower.startswith("**action"):
-                current_section = "action"
-                if ":" in line:
-                    content = line.split(":", 1)[1].strip()
-                    if content and not content.startswith("**"):
-                        components[current_section] += content + "\n"
-            elif line_lower.startswith("**result"):
-                current_section = "result"
-                if ":" in line:
-                    content = line.split(":", 1)[1].strip()
-                    if content and not content.startswith("**"):
-                        components[current_section] += content + "\n"
-            elif current_section and line.strip() and not line.strip().startswith("**"):
-                components[current_section] += line.strip() + "\n"
-
-        # Clean up whitespace
-        for key in components:
-            components[key] = components[key].strip()
-
+    def _parse_star_response(self, response):
+        """Parse STAR response into components."""
+        components = {"situation": "", "task": "", "action": "", "result": ""}
+        for match in _STAR_RE.finditer(response):
+            components[match.group(1).lower()] = match.group(2).strip()
         return components
 
     def quick_answer(self, question, transcript, format_type="bullets"):
@@ -385,48 +1331,107 @@ Create compelling, structured answers that demonstrate clear problem-solving and
         Returns:
             str: Quick answer
         """
+        try:
+            # Limit to the most relevant ~750 tokens and reduce max_tokens for speed
+            if self.use_retrieval:
+                excerpt = self._retrieve(question, transcript, top_k=2)
+            else:
+                excerpt = self._relevant_excerpt(question, transcript)
+            return self._ask(*self._quick_prompts(question, excerpt, format_type), max_tokens=1024)
+
+        except Exception as e:
+            print(f"Error generating quick answer: {e}")
+            raise
+
+    def _quick_prompts(self, question, excerpt, format_type):
+        """Build the (system, user, transcript) prompts for quick_answer."""
         # For quick answers, we use a simpler prompt and lower max_tokens
-        if format_type == "bullets":
-            prompt = f"""Question: {question}
+        template = _TMPL_QUICK_BULLETS if format_type == "bullets" else _TMPL_QUICK_FULL
+        prompt = template.format(question=question)
+        return _SYS_QUICK, prompt, self._transcript_block(excerpt, "Transcript")
 
-Based on this transcript excerpt, provide a brief STAR format answer in bullet points.
+    # Async variants: independent calls can be awaited concurrently with asyncio.gather
 
-Transcript:
-{transcript[:3000]}  # Limit to first 3000 chars for speed
+    async def prepare_answer_async(self, question, transcript, context=None):
+        """Async version of prepare_answer."""
+        try:
+            transcript = await self._retrieve_async(question, transcript)
+            return await self._ask_async(*self._answer_prompts(question, transcript, context),
+                                         max_tokens=_ANSWER_MAX_TOKENS)
 
-Be concise and focus on key points only."""
-        else:
-            prompt = f"""Question: {question}
+        except Exception as e:
+            print(f"Error generating answer: {e}")
+            raise
 
-Based on this transcript excerpt, provide a STAR format answer in 2-3 sentences per section.
+    async def generate_summary_async(self, transcript):
+        """Async version of generate_summary."""
+        try:
+            return await self._ask_async(*self._summary_prompts(transcript))
 
-Transcript:
-{transcript[:3000]}
+        except Exception as e:
+            print(f"Error generating summary: {e}")
+            raise
 
-Be concise and professional."""
+    async def generate_interview_prep_async(self, transcript):
+        """Async version of generate_interview_prep."""
+        try:
+            return await self._ask_async(*self._interview_prep_prompts(transcript))
 
-        system_prompt = "Provide concise, focused STAR format answers quickly."
+        except Exception as e:
+            print(f"Error generating interview prep: {e}")
+            raise
 
+    async def extract_questions_and_answers_async(self, transcript):
+        """Async version of extract_questions_and_answers."""
         try:
-            if self.provider == "claude":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=1024,  # Reduced for speed
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return response.content[0].text
+            return await self._ask_async(*self._qa_prompts(transcript))
+
+        except Exception as e:
+            print(f"Error extracting Q&A: {e}")
+            raise
+
+    async def generate_star_answer_async(self, question, transcript, format_type="full"):
+        """Async version of generate_star_answer."""
+        try:
+            transcript = await self._retrieve_async(question, transcript)
+            response = await self._ask_async(*self._star_prompts(question, transcript, format_type))
+            return self._star_result(response, format_type)
+
+        except Exception as e:
+            print(f"Error generating STAR answer: {e}")
+            raise
+
+    async def quick_answer_async(self, question, transcript, format_type="bullets"):
+        """Async version of quick_answer."""
+        try:
+            if self.use_retrieval:
+                excerpt = await self._retrieve_async(question, transcript, top_k=2)
             else:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=1024  # Reduced for speed
-                )
-                return response.choices[0].message.content
+                excerpt = self._relevant_excerpt(question, transcript)
+            return await self._ask_async(*self._quick_prompts(question, excerpt, format_type),
+                                         max_tokens=1024)
 
         except Exception as e:
             print(f"Error generating quick answer: {e}")
             raise
+
+    async def run_all(self, transcript):
+        """
+        Generate the summary, interview prep and Q&A document concurrently.
+
+        Args:
+            transcript: The meeting transcript
+
+        Returns:
+            dict: Contains 'summary', 'interview_prep' and 'qa'
+        """
+        summary, interview_prep, qa = await asyncio.gather(
+            self.generate_summary_async(transcript),
+            self.generate_interview_prep_async(transcript),
+            self.extract_questions_and_answers_async(transcript)
+        )
+        return {
+            "summary": summary,
+            "interview_prep": interview_prep,
+            "qa": qa
+        }
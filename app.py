@@ -3,74 +3,173 @@
 Flask web application for Meeting Recorder with real-time STAR format answers
 """
 import os
+import logging
 import time
 import json
+import queue
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
+from typing import Any, Optional
 from flask import Flask, render_template, request, jsonify, session
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-import sounddevice as sd
-import soundfile as sf
 import numpy as np
 import base64
 import io
+import types
+
+# Audio I/O (sounddevice, soundfile) and the AI SDKs are imported on first use
+# so the web routes and health checks serve immediately. audio_dsp stays here so
+# its Numba kernels are loaded at startup, not inside the first audio callback.
+from config import get_config
+from audio_dsp import is_silent, to_pcm16
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(obj, **kwargs):
+    """json.dumps-compatible wrapper; socketio passes separators=, orjson is always compact."""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
 
-from config import Config
-from transcription import Transcriber
-from ai_assistant import AIAssistant
-from realtime_processor import RealtimeProcessor
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.urandom(24)
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+# Threading mode: PortAudio callbacks, soundfile and the blocking AI SDK calls all
+# run in real threads. Background work goes through socketio.start_background_task
+# so it follows whichever async_mode is configured here.
+socketio_options = {}
+if orjson:
+    # Every emit encodes its payload; orjson is several times faster than json
+    socketio_options['json'] = types.SimpleNamespace(dumps=_orjson_dumps, loads=orjson.loads)
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', **socketio_options)
+
+# Live mode sends a window early once it holds this much audio and the speaker pauses
+LIVE_MIN_CHUNK_SECONDS = 2
+LIVE_PAUSE_SECONDS = 0.5
+
+# Live transcripts, questions and answers are sent together in one live_update
+# event at most this often
+LIVE_UPDATE_INTERVAL = 0.05
+
+# Live-mode chunk buffers are recycled instead of allocated every window
+CHUNK_POOL_SIZE = 4
+_chunk_pool = queue.LifoQueue(maxsize=CHUNK_POOL_SIZE)
+
+# Finishes stopped recordings (WAV close, live-mode drain) off the Socket.IO handlers;
+# one thread per stopping session, so a long drain does not hold up the others
+_writer_pool = ThreadPoolExecutor(thread_name_prefix='wav-writer')
+
+# Longest waits, after stopping, for queued live-mode chunks to be transcribed
+# and for the answers to questions already detected
+LIVE_DRAIN_TIMEOUT = 30
+LIVE_ANSWER_TIMEOUT = 30
 
 # Global state
-config = Config()
+config = get_config()
+logger = logging.getLogger(__name__)
+http_client = None  # shared by the Transcriber and AIAssistant SDK clients
 transcriber = None
 ai_assistant = None
-realtime_processor = None
-recording_state = {
-    'is_recording': False,
-    'audio_data': [],
-    'stream': None,
-    'start_time': None,
-    'duration': None,
-    'live_mode': False,  # Enable real-time transcription
-    'chunk_buffer': [],
-    'chunk_size': 0
-}
+
+
+@dataclass
+class RecordingSession:
+    """Recording state for one connected client."""
+    sid: str
+    is_recording: bool = False
+    wav: Any = None  # sf.SoundFile the audio callback appends to
+    filepath: Optional[str] = None
+    frames_written: int = 0
+    stop_event: threading.Event = field(default_factory=threading.Event)  # set at the duration, or on stop
+    stream: Any = None
+    start_time: Optional[float] = None
+    duration: Optional[float] = None
+    live_mode: bool = False  # Enable real-time transcription
+    processor: Any = None  # RealtimeProcessor for live mode
+    live_updates: deque = field(default_factory=deque)  # (kind, payload) awaiting the next live_update
+    chunk_buf: Any = None  # pooled (chunk_size, channels) buffer being filled
+    chunk_off: int = 0  # frames written to chunk_buf
+    chunk_voiced: bool = False  # chunk_buf contains non-silent audio
+    silent_run: int = 0  # trailing silent frames in chunk_buf
+    chunk_size: int = 0
+
+
+# One RecordingSession per Socket.IO client (request.sid), so several
+# meetings can be recorded by one server at the same time
+sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(sid):
+    """Return the RecordingSession for a client, creating it on first use."""
+    with _sessions_lock:
+        recording = sessions.get(sid)
+        if recording is None:
+            recording = sessions[sid] = RecordingSession(sid=sid)
+        return recording
 
 
 def init_services():
     """Initialize transcription and AI services."""
-    global transcriber, ai_assistant, realtime_processor
+    global http_client, transcriber, ai_assistant
+    import httpx
+    from transcription import get_transcriber
+    from ai_assistant import AIAssistant
+
+    if not http_client:
+        # One HTTP/2 pool for Whisper and the LLM so TCP+TLS stay warm between calls;
+        # the long read timeout leaves room for full-recording uploads
+        http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300),
+            timeout=httpx.Timeout(600.0, connect=5.0)
+        )
 
     if not transcriber:
-        transcriber = Transcriber(
+        transcriber = get_transcriber(
             api_key=config.openai_api_key,
-            output_dir=config.transcripts_dir
+            output_dir=config.transcripts_dir,
+            http_client=http_client
         )
 
     if not ai_assistant:
-        ai_assistant = AIAssistant(
+        ai_assistant = AIAssistant.shared(
             provider=config.ai_provider,
             anthropic_key=config.anthropic_api_key,
-            openai_key=config.openai_api_key
+            openai_key=config.openai_api_key,
+            http_client=http_client
         )
 
-    if not realtime_processor:
-        realtime_processor = RealtimeProcessor(
-            transcriber=transcriber,
-            ai_assistant=ai_assistant,
-            chunk_duration=10,  # Process every 10 seconds
-            overlap=2  # 2 second overlap
-        )
-        # Set up callbacks
-        realtime_processor.on_transcript_update = handle_transcript_update
-        realtime_processor.on_question_detected = handle_question_detected
-        realtime_processor.on_answer_ready = handle_answer_ready
+    if _chunk_pool.empty():
+        chunk_frames = int(config.sample_rate * 10)
+        for _ in range(CHUNK_POOL_SIZE):
+            _chunk_pool.put(np.empty((chunk_frames, config.channels), dtype=np.float32))
+
+
+def create_processor(recording):
+    """Create a RealtimeProcessor whose events go to one client."""
+    from realtime_processor import RealtimeProcessor
+
+    init_services()
+    processor = RealtimeProcessor(
+        transcriber=transcriber,
+        ai_assistant=ai_assistant,
+        chunk_duration=10,  # Process every 10 seconds
+        overlap=2  # 2 second overlap
+    )
+    # Set up callbacks
+    processor.on_transcript_update = partial(handle_transcript_update, recording)
+    processor.on_question_detected = partial(handle_question_detected, recording)
+    processor.on_answer_ready = partial(handle_answer_ready, recording)
+    return processor
 
 
 @app.route('/')
@@ -80,7 +179,7 @@ def index():
 
 
 @app.route('/api/config', methods=['GET'])
-def get_config():
+def api_config():
     """Get current configuration."""
     return jsonify({
         'ai_provider': config.ai_provider,
@@ -100,37 +199,113 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection."""
     print('Client disconnected')
+    with _sessions_lock:
+        recording = sessions.pop(request.sid, None)
     # Stop recording if active
-    if recording_state['is_recording']:
-        stop_recording_internal()
+    if recording and recording.is_recording:
+        stop_recording_internal(recording, disconnected=True)
+    elif recording:
+        _discard_processor(recording)
+
 
+def _acquire_chunk_buffer(frames, channels):
+    """Take a (frames, channels) float32 buffer from the pool, or allocate one."""
+    try:
+        buf = _chunk_pool.get_nowait()
+    except queue.Empty:
+        return np.empty((frames, channels), dtype=np.float32)
+
+    if buf.shape[0] >= frames and buf.shape[1] == channels:
+        return buf
+    # Wrong shape (e.g. mono fallback): keep it pooled and allocate instead
+    _release_chunk_buffer(buf)
+    return np.empty((frames, channels), dtype=np.float32)
 
-# Real-time processor callbacks
-def handle_transcript_update(chunk_text, full_transcript):
+
+def _release_chunk_buffer(buf):
+    """Return a buffer to the pool; extra buffers are left to the GC."""
+    try:
+        _chunk_pool.put_nowait(buf)
+    except queue.Full:
+        pass
+
+
+def _submit_chunk(recording, buf, frames):
+    """Queue buf[:frames] for live transcription; buf returns to the pool afterwards."""
+    if is_silent(buf[:frames]):
+        # Nothing to transcribe; skip the Whisper call entirely
+        _release_chunk_buffer(buf)
+        recording.processor.skipped_chunks += 1
+        logger.debug("Silent live chunk skipped for %s", recording.sid)
+        return
+
+    recording.processor.add_audio_chunk(
+        buf[:frames], config.sample_rate,
+        on_done=lambda: _release_chunk_buffer(buf)
+    )
+
+
+# Real-time processor callbacks: events are queued on the session and sent in
+# batches by _live_update_loop
+def handle_transcript_update(recording, chunk_text, full_transcript):
     """Handle real-time transcript updates."""
-    socketio.emit('live_transcript', {
+    recording.live_updates.append(('transcripts', {
         'chunk': chunk_text,
         'full': full_transcript,
         'timestamp': time.time()
-    })
+    }))
 
 
-def handle_question_detected(question):
+def handle_question_detected(recording, question):
     """Handle detected question."""
-    socketio.emit('question_detected', {
+    recording.live_updates.append(('questions', {
         'question': question,
         'timestamp': time.time()
-    })
+    }))
 
 
-def handle_answer_ready(question, answer, generation_time):
+def handle_answer_ready(recording, question, answer, generation_time):
     """Handle generated answer."""
-    socketio.emit('live_answer', {
+    recording.live_updates.append(('answers', {
         'question': question,
         'answer': answer,
         'time_ms': generation_time,
         'timestamp': time.time()
-    })
+    }))
+    # After the final flush nothing else sends the queue; a late answer goes out now
+    if recording.processor is None:
+        _flush_live_updates(recording)
+
+
+def _flush_live_updates(recording):
+    """Send everything queued on the session as one live_update event."""
+    update = {'transcripts': [], 'questions': [], 'answers': []}
+    pending = False
+    while True:
+        try:
+            kind, payload = recording.live_updates.popleft()
+        except IndexError:
+            break
+        update[kind].append(payload)
+        pending = True
+
+    if pending:
+        socketio.emit('live_update', update, to=recording.sid)
+
+
+def _discard_processor(recording):
+    """Stop a live-mode processor whose recording failed, ending its threads and update loop."""
+    processor = recording.processor
+    if processor is not None:
+        recording.processor = None
+        processor.stop(cancel_pending=True)
+
+
+def _live_update_loop(recording):
+    """Flush live updates every LIVE_UPDATE_INTERVAL while live mode runs."""
+    while recording.processor is not None:
+        socketio.sleep(LIVE_UPDATE_INTERVAL)
+        _flush_live_updates(recording)
 
 
 @socketio.on('start_recording')
@@ -139,55 +314,111 @@ def handle_start_recording(data):
     duration = data.get('duration', None)  # Duration in seconds
     live_mode = data.get('live_mode', False)  # Enable real-time processing
 
-    if recording_state['is_recording']:
+    recording = get_session(request.sid)
+    if recording.is_recording:
         emit('error', {'message': 'Already recording'})
         return
 
     try:
-        recording_state['is_recording'] = True
-        recording_state['audio_data'] = []
-        recording_state['start_time'] = time.time()
-        recording_state['duration'] = duration
-        recording_state['live_mode'] = live_mode
-        recording_state['chunk_buffer'] = []
-        recording_state['chunk_size'] = int(config.sample_rate * 10)  # 10 second chunks
+        recording.is_recording = True
+        recording.wav = None
+        recording.filepath = None
+        recording.frames_written = 0
+        recording.stop_event = threading.Event()
+        recording.start_time = time.time()
+        recording.duration = duration
+        recording.live_mode = live_mode
+        recording.chunk_buf = None
+        recording.chunk_off = 0
+        recording.chunk_voiced = False
+        recording.silent_run = 0
+        recording.chunk_size = int(config.sample_rate * 10)  # 10 second chunks
 
         mode_text = "LIVE" if live_mode else "standard"
         emit('status', {'message': f'Recording started in {mode_text} mode ({duration}s)', 'type': 'success'})
 
         # Start real-time processor if live mode
         if live_mode:
-            init_services()
-            realtime_processor.start()
+            recording.processor = create_processor(recording)
+            recording.processor.start()
+            socketio.start_background_task(_live_update_loop, recording)
 
         # Start recording in background thread
-        thread = threading.Thread(target=record_audio, args=(duration, live_mode))
-        thread.daemon = True
-        thread.start()
+        socketio.start_background_task(record_audio, recording)
 
     except Exception as e:
-        recording_state['is_recording'] = False
+        recording.is_recording = False
+        _discard_processor(recording)
         emit('error', {'message': f'Failed to start recording: {str(e)}'})
 
 
-def record_audio(duration, live_mode=False):
+def record_audio(recording):
     """Record audio in background thread."""
+    import sounddevice as sd
+    import soundfile as sf
+
+    sid = recording.sid
+    duration = recording.duration
+    live_mode = recording.live_mode
+    stop_event = recording.stop_event
+    duration_frames = int(duration * config.sample_rate) if duration else None
+    min_chunk_frames = int(LIVE_MIN_CHUNK_SECONDS * config.sample_rate)
+    pause_frames = int(LIVE_PAUSE_SECONDS * config.sample_rate)
+
     def audio_callback(indata, frames, time_info, status):
         if status:
             print(f"Audio status: {status}")
-        if recording_state['is_recording']:
-            recording_state['audio_data'].append(indata.copy())
-
-            # Handle live mode chunking
+        if recording.is_recording:
+            recording.wav.write(to_pcm16(indata))
+            recording.frames_written += frames
+            if duration_frames and recording.frames_written >= duration_frames:
+                stop_event.set()
+
+            # Handle live mode chunking: copy the block into the current window,
+            # splitting it when it crosses the window boundary
             if live_mode:
-                recording_state['chunk_buffer'].append(indata.copy())
-                current_size = sum(len(chunk) for chunk in recording_state['chunk_buffer'])
-
-                # Process chunk when it reaches target size
-                if current_size >= recording_state['chunk_size']:
-                    chunk_data = np.concatenate(recording_state['chunk_buffer'], axis=0)
-                    realtime_processor.add_audio_chunk(chunk_data, config.sample_rate)
-                    recording_state['chunk_buffer'] = []  # Clear buffer
+                chunk_size = recording.chunk_size
+                chunk_buf = recording.chunk_buf
+                off = recording.chunk_off
+                voiced = recording.chunk_voiced
+                silent_run = recording.silent_run
+                block_silent = is_silent(indata)
+                pos = 0
+                while pos < frames:
+                    if chunk_buf is None:
+                        chunk_buf = _acquire_chunk_buffer(chunk_size, indata.shape[1])
+                        off = 0
+                    n = min(frames - pos, chunk_size - off)
+                    chunk_buf[off:off + n] = indata[pos:pos + n]
+                    off += n
+                    pos += n
+
+                    # Process chunk when it reaches target size
+                    if off == chunk_size:
+                        _submit_chunk(recording, chunk_buf, chunk_size)
+                        chunk_buf = None
+                        off = 0
+                        voiced = False
+                        silent_run = 0
+
+                # Send speech early when the speaker pauses instead of waiting
+                # for the full window
+                if block_silent:
+                    silent_run += frames
+                else:
+                    voiced = True
+                    silent_run = 0
+                if voiced and silent_run >= pause_frames and off >= min_chunk_frames:
+                    _submit_chunk(recording, chunk_buf, off)
+                    chunk_buf = None
+                    off = 0
+                    voiced = False
+                    silent_run = 0
+
+                recording.chunk_buf = chunk_buf
+                recording.chunk_off = off
+                recording.chunk_voiced = voiced
+                recording.silent_run = silent_run
 
     try:
         # Create audio stream - try configured channels first, fallback to mono
@@ -205,7 +436,7 @@ def record_audio(duration, live_mode=False):
                 socketio.emit('status', {
                     'message': 'Stereo not supported, using mono recording',
                     'type': 'info'
-                })
+                }, to=sid)
                 channels = 1
                 stream = sd.InputStream(
                     samplerate=config.sample_rate,
@@ -215,116 +446,143 @@ def record_audio(duration, live_mode=False):
             else:
                 raise
 
-        recording_state['stream'] = stream
-        stream.start()
+        # Encode straight to disk as blocks arrive; memory use stays at one block.
+        # The session id keeps concurrent recordings from sharing a file name.
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.makedirs(config.recordings_dir, exist_ok=True)
+        filepath = os.path.join(config.recordings_dir, f"meeting_{timestamp}_{sid[:8]}.wav")
+        recording.wav = sf.SoundFile(
+            filepath, mode='w', samplerate=config.sample_rate,
+            channels=channels, subtype='PCM_16'
+        )
+        recording.filepath = filepath
 
-        # Record for specified duration
-        start_time = time.time()
-        while recording_state['is_recording']:
-            elapsed = time.time() - start_time
+        recording.stream = stream
+        stream.start()
 
-            # Send progress update
+        # Send progress once a second until stopped or the duration is reached.
+        # Elapsed time comes from the frames captured, not the wall clock.
+        while not stop_event.wait(timeout=1.0):
             socketio.emit('recording_progress', {
-                'elapsed': int(elapsed),
+                'elapsed': recording.frames_written // config.sample_rate,
                 'duration': duration
-            })
+            }, to=sid)
 
-            # Stop if duration reached
-            if duration and elapsed >= duration:
-                socketio.emit('status', {
-                    'message': 'Recording duration reached',
-                    'type': 'info'
-                })
-                stop_recording_internal()
-                break
-
-            time.sleep(0.1)
+        # Stop if duration reached
+        if recording.is_recording:
+            socketio.emit('status', {
+                'message': 'Recording duration reached',
+                'type': 'info'
+            }, to=sid)
+            stop_recording_internal(recording)
 
     except Exception as e:
         print(f"Recording error: {e}")
-        socketio.emit('error', {'message': f'Recording error: {str(e)}'})
-        recording_state['is_recording'] = False
+        socketio.emit('error', {'message': f'Recording error: {str(e)}'}, to=sid)
+        recording.is_recording = False
+        _discard_processor(recording)
+        if recording.wav:
+            recording.wav.close()
+            recording.wav = None
 
 
 @socketio.on('stop_recording')
 def handle_stop_recording():
     """Stop recording and process audio."""
-    if not recording_state['is_recording']:
+    recording = get_session(request.sid)
+    if not recording.is_recording:
         emit('error', {'message': 'Not recording'})
         return
 
-    stop_recording_internal()
+    stop_recording_internal(recording)
 
 
-def stop_recording_internal():
-    """Internal function to stop recording."""
-    if not recording_state['is_recording']:
+def stop_recording_internal(recording, disconnected=False):
+    """Internal function to stop recording; pending live answers are dropped if disconnected."""
+    if not recording.is_recording:
         return
 
-    live_mode = recording_state.get('live_mode', False)
-    recording_state['is_recording'] = False
+    recording.is_recording = False
+    recording.stop_event.set()
+
+    try:
+        # Stop stream; once it returns the audio callback no longer touches the session
+        if recording.stream:
+            recording.stream.stop()
+            recording.stream.close()
+            recording.stream = None
+    except Exception as e:
+        print(f"Error stopping recording: {e}")
+
+    # Draining live mode and closing the WAV take seconds; the handler returns now
+    # and the clients hear back from the writer thread when the file is ready
+    _writer_pool.submit(_finalize_recording, recording, disconnected)
+
+
+def _finalize_recording(recording, disconnected=False):
+    """Flush live mode, close the WAV and announce the recording (writer thread)."""
+    sid = recording.sid
+    live_mode = recording.live_mode
 
     try:
         # Stop realtime processor if in live mode
-        if live_mode and realtime_processor:
+        processor = recording.processor
+        if live_mode and processor:
             # Process any remaining chunk buffer
-            if recording_state.get('chunk_buffer'):
-                chunk_data = np.concatenate(recording_state['chunk_buffer'], axis=0)
-                realtime_processor.add_audio_chunk(chunk_data, config.sample_rate)
-
-            # Give processor time to finish current chunks
-            time.sleep(2)
-            realtime_processor.stop()
+            if recording.chunk_buf is not None and recording.chunk_off:
+                _submit_chunk(recording, recording.chunk_buf, recording.chunk_off)
+            recording.chunk_buf = None
+
+            # Let the processor finish the chunks still queued, then stop it;
+            # nobody is left to receive the results after a disconnect
+            answered = disconnected
+            if not disconnected:
+                if not processor.drain(timeout=LIVE_DRAIN_TIMEOUT):
+                    print("Live transcription did not catch up before stopping; remaining chunks dropped")
+                # Answers to the last questions are sent in the final flush below
+                answered = processor.wait_for_answers(timeout=LIVE_ANSWER_TIMEOUT)
+                if not answered:
+                    print("Some live answers are still being generated; they will be sent when ready")
+            processor.stop(cancel_pending=disconnected or not answered)
+            recording.processor = None
+            _flush_live_updates(recording)
 
             # Get statistics
-            stats = realtime_processor.get_statistics()
+            stats = processor.get_statistics()
             socketio.emit('live_session_complete', {
                 'statistics': stats,
-                'full_transcript': realtime_processor.full_transcript
-            })
+                'full_transcript': processor.full_transcript
+            }, to=sid)
 
-        # Stop stream
-        if recording_state['stream']:
-            recording_state['stream'].stop()
-            recording_state['stream'].close()
-
-        # Process audio
-        if recording_state['audio_data']:
-            socketio.emit('status', {
-                'message': 'Processing audio...',
-                'type': 'info'
-            })
-
-            # Save audio file
-            audio_array = np.concatenate(recording_state['audio_data'], axis=0)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"meeting_{timestamp}.wav"
-
-            os.makedirs(config.recordings_dir, exist_ok=True)
-            filepath = os.path.join(config.recordings_dir, filename)
-            sf.write(filepath, audio_array, config.sample_rate)
+        # The WAV was written during recording; closing finalizes its header
+        filepath = recording.filepath
+        if recording.wav:
+            recording.wav.close()
+            recording.wav = None
 
+        if recording.frames_written:
+            filename = os.path.basename(filepath)
             socketio.emit('recording_complete', {
                 'filename': filename,
                 'filepath': filepath,
-                'duration': time.time() - recording_state['start_time'],
+                'duration': recording.frames_written / config.sample_rate,
                 'live_mode': live_mode
-            })
+            }, to=sid)
 
             # Only do full transcription if not in live mode
             if not live_mode:
-                thread = threading.Thread(target=transcribe_audio, args=(filepath,))
-                thread.daemon = True
-                thread.start()
+                socketio.start_background_task(transcribe_audio, filepath, sid)
         else:
-            socketio.emit('error', {'message': 'No audio data recorded'})
+            if filepath and os.path.exists(filepath):
+                os.remove(filepath)
+            socketio.emit('error', {'message': 'No audio data recorded'}, to=sid)
 
     except Exception as e:
         print(f"Error stopping recording: {e}")
-        socketio.emit('error', {'message': f'Error processing audio: {str(e)}'})
+        socketio.emit('error', {'message': f'Error processing audio: {str(e)}'}, to=sid)
 
 
-def transcribe_audio(filepath):
+def transcribe_audio(filepath, sid):
     """Transcribe audio in background."""
     try:
         init_services()
@@ -332,9 +590,10 @@ def transcribe_audio(filepath):
         socketio.emit('status', {
             'message': 'Transcribing audio...',
             'type': 'info'
-        })
+        }, to=sid)
 
         start_time = time.time()
+        # Identical audio (a retry or re-upload) is served from the Transcriber's cache
         result = transcriber.transcribe_audio(filepath, save_transcript=True)
         transcription_time = int((time.time() - start_time) * 1000)  # milliseconds
 
@@ -351,16 +610,16 @@ def transcribe_audio(filepath):
             'file_path': result.get('file_path'),
             'time_ms': transcription_time,
             'questions_detected': len(questions)
-        })
+        }, to=sid)
 
         # Auto-generate answers for detected questions
         if questions and len(questions) > 0:
             socketio.emit('status', {
                 'message': f'Found {len(questions)} questions, generating answers...',
                 'type': 'info'
-            })
+            }, to=sid)
 
-            for question in questions[:5]:  # Limit to first 5 questions
+            def answer(question):
                 try:
                     print(f"[Transcription] Generating answer for: {question[:60]}...")
                     answer_start = time.time()
@@ -371,13 +630,19 @@ def transcribe_audio(filepath):
                         'question': question,
                         'answer': answer,
                         'time_ms': answer_time
-                    })
+                    }, to=sid)
                 except Exception as e:
                     print(f"[Transcription] Error generating answer: {e}")
 
+            # Requests run concurrently on the shared sync client and its pooled
+            # connections; each answer is emitted as soon as it is ready
+            selected = questions[:5]  # Limit to first 5 questions
+            with ThreadPoolExecutor(max_workers=len(selected), thread_name_prefix='auto-answer') as executor:
+                list(executor.map(answer, selected))
+
     except Exception as e:
         print(f"Transcription error: {e}")
-        socketio.emit('error', {'message': f'Transcription failed: {str(e)}'})
+        socketio.emit('error', {'message': f'Transcription failed: {str(e)}'}, to=sid)
 
 
 @socketio.on('get_answer')
@@ -462,6 +727,9 @@ def test_api():
 
 
 if __name__ == '__main__':
+    # Diagnostic output from the live pipeline, e.g. LOG_LEVEL=DEBUG
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+
     print("\n" + "=" * 80)
     print("Meeting Recorder Web Application")
     print("=" * 80)
@@ -0,0 +1,284 @@
+"""
+Audio signal helpers for the recording pipeline.
+Kernels are compiled with Numba when it is installed and fall back to NumPy otherwise.
+"""
+import struct
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# Chunks quieter than this are treated as silence and not sent for transcription
+SILENCE_THRESHOLD_DB = -50.0
+
+# Whisper's working format: audio is resampled to 16 kHz mono server-side anyway
+WHISPER_SAMPLE_RATE = 16000
+
+# Canonical 44-byte PCM WAV header: RIFF size, fmt chunk, data size
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+WAV_HEADER_SIZE = _WAV_HEADER.size
+
+# Resampling filter length per polyphase branch (Kaiser-windowed sinc)
+_TAPS_PER_PHASE = 32
+_KAISER_BETA = 8.6
+
+
+if HAVE_NUMBA:
+    # Compiled eagerly for the (frames, channels) C-contiguous float32 buffers the
+    # recorder produces; cache=True keeps the machine code on disk between runs.
+    # Serial, like _pcm16: it runs in the audio callback next to other kernels.
+    @njit("float64(float32[:, ::1])", fastmath=True, cache=True)
+    def _rms_db(x):
+        frames, channels = x.shape
+        total = 0.0
+        for i in range(frames):
+            for c in range(channels):
+                total += x[i, c] * x[i, c]
+        return 10.0 * np.log10(total / max(frames * channels, 1) + 1e-12)
+else:
+    def _rms_db(x):
+        mean_square = float(np.mean(np.square(x, dtype=np.float64))) if x.size else 0.0
+        return 10.0 * np.log10(mean_square + 1e-12)
+
+
+if HAVE_NUMBA:
+    # Serial: it runs on the processor thread while the audio callback runs
+    # _pcm16 and _rms_db, and parallel regions must not overlap (see _pcm16)
+    @njit("float32[::1](float32[::1], float32[::1], int64, int64, int64)",
+          fastmath=True, cache=True)
+    def _polyphase(x, h, up, down, n_out):
+        taps = h.shape[0] // up
+        delay = h.shape[0] // 2
+        n_in = x.shape[0]
+        y = np.empty(n_out, dtype=np.float32)
+        for n in range(n_out):
+            pos = n * down + delay
+            phase = pos % up
+            base = pos // up
+            acc = 0.0
+            for j in range(taps):
+                i = base - j
+                if 0 <= i < n_in:
+                    acc += h[phase + j * up] * x[i]
+            y[n] = acc
+        return y
+else:
+    def _polyphase(x, h, up, down, n_out, block=65536):
+        taps = h.shape[0] // up
+        delay = h.shape[0] // 2
+        padded = np.concatenate([np.zeros(taps, np.float32), x, np.zeros(taps, np.float32)])
+        y = np.empty(n_out, dtype=np.float32)
+        j = np.arange(taps)
+        for start in range(0, n_out, block):
+            pos = np.arange(start, min(start + block, n_out), dtype=np.int64) * down + delay
+            phase = (pos % up)[:, None]
+            base = (pos // up)[:, None]
+            y[start:start + len(pos)] = np.sum(h[phase + j * up] * padded[base - j + taps], axis=1)
+        return y
+
+
+if HAVE_NUMBA:
+    # Serial on purpose: this runs on the audio callback thread concurrently with
+    # other kernels, and Numba's default workqueue threading layer aborts the
+    # process on concurrent parallel regions
+    @njit("void(float32[::1], int16[::1])", fastmath=True, cache=True)
+    def _pcm16(x, out):
+        for i in range(x.shape[0]):
+            v = np.floor(x[i] * 32768.0)
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            out[i] = np.int16(v)
+else:
+    def _pcm16(x, out, block=1 << 20):
+        # Blocked so the float scratch stays small for long recordings
+        scratch = np.empty(min(block, x.shape[0]), dtype=np.float32)
+        for start in range(0, x.shape[0], block):
+            seg = scratch[:min(block, x.shape[0] - start)]
+            np.multiply(x[start:start + len(seg)], 32768.0, out=seg)
+            np.floor(seg, out=seg)
+            np.clip(seg, -32768.0, 32767.0, out=seg)
+            out[start:start + len(seg)] = seg
+
+
+@lru_cache(maxsize=8)
+def _resample_filter(up, down):
+    """Anti-aliasing low-pass for rational resampling by up/down, gain-scaled by up."""
+    n = _TAPS_PER_PHASE * up
+    cutoff = 0.5 / max(up, down)  # in cycles per upsampled sample
+    # Odd-length design centred on tap n // 2 (an integer delay); the last,
+    # near-zero tap is dropped so the filter splits evenly into up phases
+    k = np.arange(n + 1) - n / 2.0
+    h = (2.0 * cutoff * np.sinc(2.0 * cutoff * k) * np.kaiser(n + 1, _KAISER_BETA))[:n]
+    return (h * (up / h.sum())).astype(np.float32)
+
+
+def rms_db(audio):
+    """
+    Root-mean-square level of an audio buffer in dBFS.
+
+    Args:
+        audio: float32 array of shape (frames,) or (frames, channels)
+
+    Returns:
+        float: RMS level in dB relative to full scale
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim == 1:
+        audio = audio.reshape(-1, 1)
+    return _rms_db(np.ascontiguousarray(audio))
+
+
+def downmix_resample(audio, sr_in, sr_out=WHISPER_SAMPLE_RATE):
+    """
+    Average channels to mono and resample with a polyphase windowed-sinc filter.
+
+    Args:
+        audio: float32 array of shape (frames,) or (frames, channels)
+        sr_in: Sample rate of audio in Hz
+        sr_out: Target sample rate in Hz
+
+    Returns:
+        np.ndarray: Mono float32 audio at sr_out
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    mono = audio.mean(axis=1, dtype=np.float32) if audio.ndim == 2 else audio
+    mono = np.ascontiguousarray(mono)
+
+    g = gcd(int(sr_in), int(sr_out))
+    up, down = int(sr_out) // g, int(sr_in) // g
+    if up == down:
+        return mono
+
+    n_out = (len(mono) * up + down - 1) // down
+    return _polyphase(mono, _resample_filter(up, down), up, down, n_out)
+
+
+def is_silent(audio, threshold_db=SILENCE_THRESHOLD_DB):
+    """
+    Check whether an audio buffer is below the silence threshold.
+
+    Args:
+        audio: float32 array of shape (frames,) or (frames, channels)
+        threshold_db: Level in dBFS below which the buffer counts as silence
+
+    Returns:
+        bool: True if the buffer is silent
+    """
+    return rms_db(audio) < threshold_db
+
+
+def strip_silence(audio, sample_rate, threshold_db=SILENCE_THRESHOLD_DB, frame_ms=30, max_gap=0.5):
+    """
+    Shorten silent stretches so less audio has to be uploaded and transcribed.
+
+    Frames of frame_ms quieter than threshold_db count as silence. Any silent run
+    longer than max_gap is cut down to max_gap, keeping its first and last halves
+    so speech still starts and ends naturally.
+
+    Args:
+        audio: float32 array of shape (frames,) or (frames, channels)
+        sample_rate: Sample rate of audio in Hz
+        threshold_db: Frame level in dBFS below which a frame is silent
+        frame_ms: Analysis frame length in milliseconds
+        max_gap: Longest silence kept, in seconds
+
+    Returns:
+        np.ndarray: audio with long silences shortened (empty if all silent)
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    hop = max(int(sample_rate * frame_ms / 1000), 1)
+    n_frames = -(-len(audio) // hop)
+    if n_frames == 0:
+        return audio
+
+    # Per-frame mean square over all channels; the last frame may be short
+    squares = np.square(audio, dtype=np.float64).reshape(len(audio), -1).mean(axis=1)
+    sums = np.add.reduceat(squares, np.arange(0, len(audio), hop))
+    counts = np.diff(np.append(np.arange(0, len(audio), hop), len(audio)))
+    silent = 10.0 * np.log10(sums / counts + 1e-12) < threshold_db
+
+    keep_frames = max(int(max_gap * 1000 / frame_ms), 1)
+    keep = np.ones(n_frames, dtype=bool)
+    # Boundaries of silent runs: starts where silence begins, ends where it stops
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    for start, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        if end - start > keep_frames:
+            head = keep_frames // 2
+            keep[start + head:end - (keep_frames - head)] = False
+
+    if keep.all():
+        return audio
+    if not (~silent).any():
+        return audio[:0]
+    return audio[np.repeat(keep, hop)[:len(audio)]]
+
+
+def to_pcm16(audio, out=None):
+    """
+    Quantize float audio in [-1, 1] to 16-bit PCM, clipping out-of-range samples.
+
+    Uses the same 32768 scale and rounding as libsndfile, so writing the result
+    to a PCM_16 file stores the same samples as writing the float buffer.
+
+    Args:
+        audio: float32 array of shape (frames,) or (frames, channels)
+        out: Optional C-contiguous int16 array of the same shape to write into
+
+    Returns:
+        np.ndarray: int16 array with the shape of audio
+    """
+    audio = np.ascontiguousarray(audio, dtype=np.float32)
+    if out is None:
+        out = np.empty(audio.shape, dtype=np.int16)
+    _pcm16(audio.reshape(-1), out.reshape(-1))
+    return out
+
+
+def encode_wav_pcm16(audio, sample_rate, out=None):
+    """
+    Encode float audio as an in-memory 16-bit PCM WAV file.
+
+    The samples are quantized straight into the buffer behind a fixed header,
+    so no encoder runs and no intermediate copy is made.
+
+    Args:
+        audio: float32 array of shape (frames,) or (frames, channels)
+        sample_rate: Sample rate of audio in Hz
+        out: Optional buffer to encode into, letting a caller reuse one buffer
+            across many chunks: a bytearray (grown if too small) or any writable
+            buffer of at least the encoded size, such as BytesIO.getbuffer()
+
+    Returns:
+        bytearray or memoryview: Complete WAV file contents (a view of the
+        used part of out when out is given)
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    data_size = audio.size * 2
+    size = WAV_HEADER_SIZE + data_size
+    if out is None:
+        buf = bytearray(size)
+    else:
+        buf = out
+        if len(buf) < size:
+            if not isinstance(buf, bytearray):
+                raise ValueError(f"out holds {len(buf)} bytes, {size} needed")
+            buf.extend(bytes(size - len(buf)))
+    _WAV_HEADER.pack_into(
+        buf, 0, b'RIFF', WAV_HEADER_SIZE - 8 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+        b'data', data_size
+    )
+    pcm = np.frombuffer(buf, dtype='<i2', count=audio.size, offset=WAV_HEADER_SIZE)
+    to_pcm16(audio, out=pcm.reshape(audio.shape))
+    del pcm  # release the export so out can be resized on the next call
+    return buf if out is None else memoryview(buf)[:size]
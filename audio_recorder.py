@@ -9,11 +9,16 @@ import os
 import threading
 import time
 
+from audio_dsp import to_pcm16
+
+# Recording buffer growth step; memory tracks the recorded length, not max_duration
+BLOCK_SECONDS = 60
+
 
 class AudioRecorder:
     """Records audio from the default microphone."""
 
-    def __init__(self, sample_rate=44100, channels=2, output_dir="recordings"):
+    def __init__(self, sample_rate=44100, channels=2, output_dir="recordings", max_duration=7200):
         """
         Initialize the audio recorder.
 
@@ -21,14 +26,21 @@ class AudioRecorder:
             sample_rate: Sample rate in Hz
             channels: Number of audio channels (1=mono, 2=stereo)
             output_dir: Directory to save recordings
+            max_duration: Longest recording in seconds; audio beyond it is dropped
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.output_dir = output_dir
+        self.max_duration = max_duration
         self.recording = False
-        self.audio_data = []
         self.stream = None
 
+        # Recording buffer: fixed-size blocks allocated as audio arrives, _write_idx frames in total
+        self._blocks = []
+        self._block_frames = 0
+        self._max_frames = 0
+        self._write_idx = 0
+
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
 
@@ -36,8 +48,17 @@ class AudioRecorder:
         """Callback function for audio stream."""
         if status:
             print(f"Status: {status}")
-        if self.recording:
-            self.audio_data.append(indata.copy())
+        if not self.recording:
+            return
+        pos = 0
+        while pos < frames and self._write_idx < self._max_frames:
+            off = self._write_idx % self._block_frames
+            if off == 0:
+                self._blocks.append(np.empty((self._block_frames, indata.shape[1]), dtype=np.float32))
+            n = min(frames - pos, self._block_frames - off, self._max_frames - self._write_idx)
+            self._blocks[-1][off:off + n] = indata[pos:pos + n]
+            pos += n
+            self._write_idx += n
 
     def start_recording(self):
         """Start recording audio."""
@@ -46,8 +67,6 @@ class AudioRecorder:
             return
 
         print("Starting recording...")
-        self.recording = True
-        self.audio_data = []
 
         # Try configured channels first, fallback to mono if needed
         try:
@@ -68,6 +87,13 @@ class AudioRecorder:
             else:
                 raise
 
+        # Sized from self.channels only after the mono fallback above has settled it
+        self._blocks = []
+        self._block_frames = self.sample_rate * BLOCK_SECONDS
+        self._max_frames = self.sample_rate * self.max_duration
+        self._write_idx = 0
+        self.recording = True
+
         self.stream.start()
         print("Recording started. Press Enter or call stop_recording() to stop.")
 
@@ -92,12 +118,16 @@ class AudioRecorder:
             self.stream.stop()
             self.stream.close()
 
-        # Concatenate all audio chunks
-        if not self.audio_data:
+        blocks, frames = self._blocks, self._write_idx
+        self._blocks = []
+        self._write_idx = 0
+
+        if not frames:
             print("No audio data recorded!")
             return None
 
-        audio_array = np.concatenate(self.audio_data, axis=0)
+        if frames == self._max_frames:
+            print(f"Recording reached the {self.max_duration}s limit; later audio was dropped.")
 
         # Generate filename if not provided
         if filename is None:
@@ -106,8 +136,14 @@ class AudioRecorder:
 
         filepath = os.path.join(self.output_dir, filename)
 
-        # Save audio file
-        sf.write(filepath, audio_array, self.sample_rate)
+        # Save as 16-bit PCM: half the size of float32 WAV, same quality for a microphone.
+        # Blocks are written one at a time so the recording is never concatenated in memory.
+        with sf.SoundFile(filepath, 'w', samplerate=self.sample_rate,
+                          channels=blocks[0].shape[1], subtype='PCM_16') as f:
+            for block in blocks:
+                n = min(frames, len(block))
+                f.write(to_pcm16(block[:n]))
+                frames -= n
         print(f"Recording saved to: {filepath}")
 
         return filepath
@@ -2,9 +2,15 @@
 Configuration management for the meeting recorder application.
 """
 import os
+import threading
 from dotenv import load_dotenv
 
 
+def _env_int(name, default):
+    """Read an integer environment variable."""
+    return int(os.getenv(name, str(default)))
+
+
 class Config:
     """Application configuration."""
 
@@ -24,8 +30,8 @@ class Config:
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
 
         # Recording Settings
-        self.sample_rate = int(os.getenv("SAMPLE_RATE", "44100"))
-        self.channels = int(os.getenv("CHANNELS", "2"))
+        self.sample_rate = _env_int("SAMPLE_RATE", 44100)
+        self.channels = _env_int("CHANNELS", 2)
 
         # Directory Settings
         self.recordings_dir = "recordings"
@@ -60,3 +66,24 @@ class Config:
         print(f"Recordings Directory: {self.recordings_dir}")
         print(f"Transcripts Directory: {self.transcripts_dir}")
         print("=" * 60 + "\n")
+
+
+_CONFIGS = {}
+_CONFIGS_LOCK = threading.Lock()
+
+
+def get_config(env_file=".env"):
+    """
+    Return the process-wide Config for an env file, loading it on first use.
+
+    Args:
+        env_file: Path to the .env file
+
+    Returns:
+        Config: Shared configuration instance
+    """
+    with _CONFIGS_LOCK:
+        config = _CONFIGS.get(env_file)
+        if config is None:
+            config = _CONFIGS[env_file] = Config(env_file)
+        return config
@@ -5,9 +5,10 @@ Meeting Recorder - Record meetings and get AI-powered answers
 import sys
 import os
 import argparse
-from config import Config
+import logging
+from config import get_config
 from audio_recorder import AudioRecorder
-from transcription import Transcriber
+from transcription import get_transcriber
 from ai_assistant import AIAssistant
 
 
@@ -21,11 +22,30 @@ class MeetingRecorder:
         Args:
             config: Configuration object. If None, loads from .env
         """
-        self.config = config or Config()
+        self.config = config or get_config()
         self.recorder = None
         self.transcriber = None
         self.assistant = None
 
+    def _ensure_transcriber(self):
+        """Fetch the shared Transcriber on first use."""
+        if self.transcriber is None:
+            self.transcriber = get_transcriber(
+                api_key=self.config.openai_api_key,
+                output_dir=self.config.transcripts_dir
+            )
+        return self.transcriber
+
+    def _ensure_assistant(self):
+        """Fetch the shared AIAssistant for the configured provider on first use."""
+        if self.assistant is None:
+            self.assistant = AIAssistant.shared(
+                provider=self.config.ai_provider,
+                anthropic_key=self.config.anthropic_api_key,
+                openai_key=self.config.openai_api_key
+            )
+        return self.assistant
+
     def record_meeting(self, duration=None, filename=None):
         """
         Record a meeting.
@@ -37,12 +57,15 @@ class MeetingRecorder:
         Returns:
             str: Path to the recorded audio file
         """
-        # Initialize recorder
-        self.recorder = AudioRecorder(
-            sample_rate=self.config.sample_rate,
-            channels=self.config.channels,
-            output_dir=self.config.recordings_dir
-        )
+        # Initialize recorder; reused across recordings while the settings match
+        settings = (self.config.sample_rate, self.config.channels, self.config.recordings_dir)
+        recorder = self.recorder
+        if recorder is None or (recorder.sample_rate, recorder.channels, recorder.output_dir) != settings:
+            self.recorder = AudioRecorder(
+                sample_rate=self.config.sample_rate,
+                channels=self.config.channels,
+                output_dir=self.config.recordings_dir
+            )
 
         if duration:
             # Record for specific duration
@@ -65,13 +88,7 @@ class MeetingRecorder:
         Returns:
             dict: Transcription result
         """
-        if not self.transcriber:
-            self.transcriber = Transcriber(
-                api_key=self.config.openai_api_key,
-                output_dir=self.config.transcripts_dir
-            )
-
-        return self.transcriber.transcribe_audio(audio_path)
+        return self._ensure_transcriber().transcribe_audio(audio_path)
 
     def start_qa_session(self, transcript_text):
         """
@@ -80,14 +97,7 @@ class MeetingRecorder:
         Args:
             transcript_text: The meeting transcript text
         """
-        if not self.assistant:
-            self.assistant = AIAssistant(
-                provider=self.config.ai_provider,
-                anthropic_key=self.config.anthropic_api_key,
-                openai_key=self.config.openai_api_key
-            )
-
-        self.assistant.interactive_qa(transcript_text)
+        self._ensure_assistant().interactive_qa(transcript_text)
 
     def generate_summary(self, transcript_text):
         """
@@ -99,14 +109,7 @@ class MeetingRecorder:
         Returns:
             str: Meeting summary
         """
-        if not self.assistant:
-            self.assistant = AIAssistant(
-                provider=self.config.ai_provider,
-                anthropic_key=self.config.anthropic_api_key,
-                openai_key=self.config.openai_api_key
-            )
-
-        return self.assistant.generate_summary(transcript_text)
+        return self._ensure_assistant().generate_summary(transcript_text)
 
     def generate_qa_document(self, transcript_text, output_file=None):
         """
@@ -119,14 +122,7 @@ class MeetingRecorder:
         Returns:
             str: Q&A document content
         """
-        if not self.assistant:
-            self.assistant = AIAssistant(
-                provider=self.config.ai_provider,
-                anthropic_key=self.config.anthropic_api_key,
-                openai_key=self.config.openai_api_key
-            )
-
-        qa_content = self.assistant.extract_questions_and_answers(transcript_text)
+        qa_content = self._ensure_assistant().extract_questions_and_answers(transcript_text)
 
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -146,14 +142,7 @@ class MeetingRecorder:
         Returns:
             str: Interview prep content
         """
-        if not self.assistant:
-            self.assistant = AIAssistant(
-                provider=self.config.ai_provider,
-                anthropic_key=self.config.anthropic_api_key,
-                openai_key=self.config.openai_api_key
-            )
-
-        prep_content = self.assistant.generate_interview_prep(transcript_text)
+        prep_content = self._ensure_assistant().generate_interview_prep(transcript_text)
 
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -246,6 +235,12 @@ class MeetingRecorder:
         print(f"Transcript: {transcript_path}")
 
 
+def _read_transcript_file(path):
+    """Read a UTF-8 transcript in one buffered binary read and decode it once."""
+    with open(path, 'rb', buffering=1 << 20) as f:
+        return f.read().decode('utf-8')
+
+
 def main():
     """Main entry point for the CLI application."""
     parser = argparse.ArgumentParser(
@@ -296,14 +291,29 @@ Examples:
 
     args = parser.parse_args()
 
+    # Listing devices and printing help need no configuration; skip loading .env
+    needs_config = args.show_config or (not args.list_devices and any((
+        args.workflow, args.record, args.transcribe, args.qa,
+        args.summary, args.extract_qa, args.interview_prep
+    )))
+    if not needs_config:
+        if args.list_devices:
+            AudioRecorder.list_audio_devices()
+        else:
+            parser.print_help()
+        return 0
+
     # Load configuration
     try:
-        config = Config()
+        config = get_config()
     except Exception as e:
         print(f"Error loading configuration: {e}")
         print("\nPlease create a .env file based on .env.example and set your API keys.")
         return 1
 
+    # Diagnostic output from the live pipeline, e.g. LOG_LEVEL=DEBUG
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+
     # Initialize app
     app = MeetingRecorder(config)
 
@@ -312,9 +322,6 @@ Examples:
         if args.show_config:
             config.print_config()
 
-        elif args.list_devices:
-            AudioRecorder.list_audio_devices()
-
         elif args.workflow:
             app.full_workflow(args.duration)
 
@@ -330,43 +337,40 @@ Examples:
             print(f"\nTranscript:\n{result['text']}")
 
         elif args.qa:
-            if not os.path.exists(args.qa):
+            try:
+                transcript = _read_transcript_file(args.qa)
+            except FileNotFoundError:
                 print(f"Error: Transcript file not found: {args.qa}")
                 return 1
-            with open(args.qa, 'r', encoding='utf-8') as f:
-                transcript = f.read()
             app.start_qa_session(transcript)
 
         elif args.summary:
-            if not os.path.exists(args.summary):
+            try:
+                transcript = _read_transcript_file(args.summary)
+            except FileNotFoundError:
                 print(f"Error: Transcript file not found: {args.summary}")
                 return 1
-            with open(args.summary, 'r', encoding='utf-8') as f:
-                transcript = f.read()
             summary = app.generate_summary(transcript)
             print(f"\nSummary:\n{summary}")
 
         elif args.extract_qa:
-            if not os.path.exists(args.extract_qa):
+            try:
+                transcript = _read_transcript_file(args.extract_qa)
+            except FileNotFoundError:
                 print(f"Error: Transcript file not found: {args.extract_qa}")
                 return 1
-            with open(args.extract_qa, 'r', encoding='utf-8') as f:
-                transcript = f.read()
             qa_doc = app.generate_qa_document(transcript)
             print(f"\nQuestions & Answers:\n{qa_doc}")
 
         elif args.interview_prep:
-            if not os.path.exists(args.interview_prep):
+            try:
+                transcript = _read_transcript_file(args.interview_prep)
+            except FileNotFoundError:
                 print(f"Error: Transcript file not found: {args.interview_prep}")
                 return 1
-            with open(args.interview_prep, 'r', encoding='utf-8') as f:
-                transcript = f.read()
             prep = app.generate_interview_prep(transcript)
             print(f"\nInterview Prep:\n{prep}")
 
-        else:
-            parser.print_help()
-
         return 0
 
     except KeyboardInterrupt:
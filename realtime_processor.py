@@ -2,12 +2,73 @@
 Real-time audio processing module for live transcription and question detection.
 Processes audio in chunks to enable real-time responses during long meetings/interviews.
 """
+import io
+import logging
 import re
 import queue
 import threading
 import time
-from collections import deque
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+
+from audio_dsp import downmix_resample, encode_wav_pcm16, WAV_HEADER_SIZE, WHISPER_SAMPLE_RATE
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Queue entry for one block of audio awaiting transcription; on_done (or None)
+# is called once the audio buffer may be reused
+AudioChunk = namedtuple('AudioChunk', 'audio sample_rate timestamp on_done')
+
+
+def _build_keyword_automaton(keywords):
+    """Aho-Corasick automaton matching any of keywords, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_pattern_database(patterns):
+    """Hyperscan database matching any of patterns caselessly, or None without hyperscan."""
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[p.encode() for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error as e:
+        logger.warning("Hyperscan could not compile question patterns, using re: %s", e)
+        return None
+    return database
+
+
+def _stop_on_match(*_):
+    # Returning True ends the scan at the first match
+    return True
 
 
 class QuestionDetector:
@@ -28,14 +89,11 @@ class QuestionDetector:
         r'\b(have you|do you|did you|are you|were you|will you)\b',
 
         # Interview-specific phrases
-        r'\b(your experience with|your role in|your approach to)\b',
-        r'\b(situation where|project where|time when)\b',
         r'\b(challenge|difficult|problem|conflict)\b.*\b(faced|handled|solved|dealt with)\b',
         r'\b(strength|weakness|achievement|failure)\b',
 
         # Prompts that request information
         r'\b(I\'d like to|I want to|I\'m interested in)\b.*\b(know|hear|understand)\b',
-        r'\b(could you tell|would you share|can you describe)\b',
 
         # Open-ended prompts
         r'\b(your thoughts on|your opinion about|your view of)\b',
@@ -51,6 +109,20 @@ class QuestionDetector:
         'approach', 'handle', 'deal with', 'think about', 'feel about'
     ]
 
+    # One linear scan finds any strong indicator, instead of a substring test per keyword
+    _INDICATOR_AUTOMATON = _build_keyword_automaton(STRONG_INDICATORS)
+
+    # All patterns in one alternation, so a sentence is scanned once
+    _COMBINED_RE = re.compile("|".join(f"(?:{p})" for p in QUESTION_PATTERNS), re.IGNORECASE)
+    # A sentence is a run of text between terminators or line breaks
+    _SENT_RE = re.compile(r'[^.!?\n]+')
+
+    # The same patterns as a Hyperscan DFA when available. Its \b is ASCII-only,
+    # so non-ASCII text still goes through _COMBINED_RE.
+    _PATTERN_DB = _build_pattern_database(QUESTION_PATTERNS)
+    # Hyperscan scratch space is not thread-safe; each thread allocates its own
+    _scratch = threading.local()
+
     @staticmethod
     def is_question(text):
         """
@@ -62,24 +134,52 @@ class QuestionDetector:
         Returns:
             bool: True if text appears to be a question
         """
-        text_lower = text.lower().strip()
+        return QuestionDetector._is_question_lowered(text.lower().strip())
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_question_lowered(text_lower, may_have_mark=True):
+        """
+        is_question for text the caller has already lowercased and stripped.
 
+        Memoized: re-transcribed sentences skip the keyword and pattern scans.
+
+        Args:
+            text_lower: Lowercased, stripped text
+            may_have_mark: False when the caller knows the text has no '?',
+                which skips that scan
+
+        Returns:
+            bool: True if text appears to be a question
+        """
         # Check for question mark
-        if '?' in text:
+        if may_have_mark and '?' in text_lower:
             return True
 
         # Check strong indicators first
-        for indicator in QuestionDetector.STRONG_INDICATORS:
-            if indicator in text_lower:
-                print(f"[QuestionDetector] Strong indicator found: '{indicator}'")
+        automaton = QuestionDetector._INDICATOR_AUTOMATON
+        if automaton is not None:
+            for _, indicator in automaton.iter(text_lower):
+                logger.debug("[QuestionDetector] Strong indicator found: '%s'", indicator)
                 return True
+        else:
+            for indicator in QuestionDetector.STRONG_INDICATORS:
+                if indicator in text_lower:
+                    logger.debug("[QuestionDetector] Strong indicator found: '%s'", indicator)
+                    return True
 
         # Check patterns
-        for pattern in QuestionDetector.QUESTION_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        database = QuestionDetector._PATTERN_DB
+        if database is not None and text_lower.isascii():
+            scratch = getattr(QuestionDetector._scratch, 'scratch', None)
+            if scratch is None:
+                scratch = QuestionDetector._scratch.scratch = hyperscan.Scratch(database)
+            try:
+                database.scan(text_lower.encode(), match_event_handler=_stop_on_match, scratch=scratch)
+            except hyperscan.ScanTerminated:
                 return True
-
-        return False
+            return False
+        return QuestionDetector._COMBINED_RE.search(text_lower) is not None
 
     @staticmethod
     def extract_questions(text):
@@ -93,26 +193,26 @@ class QuestionDetector:
             list: List of detected questions
         """
         questions = []
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        # Split into sentences - more flexible splitting
-        sentences = re.split(r'[.!?]+|\n+', text)
-
-        print(f"[QuestionDetector] Analyzing text with {len(sentences)} sentences")
-
-        for sentence in sentences:
-            sentence = sentence.strip()
+        # Walk the sentences in place rather than splitting into a list first
+        for match in QuestionDetector._SENT_RE.finditer(text):
+            sentence = match.group().strip()
             if sentence and len(sentence) > 10:  # Minimum length
-                is_q = QuestionDetector.is_question(sentence)
-                print(f"[QuestionDetector] '{sentence[:50]}...' -> Question: {is_q}")
+                # Sentence spans never contain '?', so only the keyword checks run
+                is_q = QuestionDetector._is_question_lowered(sentence.lower(), may_have_mark=False)
+                if debug:
+                    logger.debug("[QuestionDetector] '%s...' -> Question: %s", sentence[:50], is_q)
 
                 if is_q:
                     # Add question mark if missing
                     if not sentence.endswith('?'):
                         sentence += '?'
                     questions.append(sentence)
-                    print(f"[QuestionDetector] ✓ Added question: {sentence[:60]}...")
+                    if debug:
+                        logger.debug("[QuestionDetector] ✓ Added question: %s...", sentence[:60])
 
-        print(f"[QuestionDetector] Found {len(questions)} questions total")
+        logger.debug("[QuestionDetector] Found %d questions total", len(questions))
         return questions
 
 
@@ -121,7 +221,8 @@ class RealtimeProcessor:
     Processes audio in real-time for live transcription and answer generation.
     """
 
-    def __init__(self, transcriber, ai_assistant, chunk_duration=10, overlap=2):
+    def __init__(self, transcriber, ai_assistant, chunk_duration=10, overlap=2, max_batch_seconds=20,
+                 max_prompt_chars=8000, max_queue_chunks=8, max_answer_workers=4):
         """
         Initialize real-time processor.
 
@@ -130,20 +231,38 @@ class RealtimeProcessor:
             ai_assistant: AIAssistant instance
             chunk_duration: Duration of each audio chunk in seconds
             overlap: Overlap between chunks in seconds (to avoid word cutoffs)
+            max_batch_seconds: Chunks already queued are sent to Whisper together,
+                up to this much audio per request
+            max_prompt_chars: Most recent transcript characters sent with each question,
+                so answer cost stays flat as the meeting grows
+            max_queue_chunks: Chunks waiting for transcription before the oldest is
+                dropped, so a stalled upload cannot pile up audio
+            max_answer_workers: Answers generated concurrently; further questions wait
         """
         self.transcriber = transcriber
         self.ai_assistant = ai_assistant
         self.chunk_duration = chunk_duration
         self.overlap = overlap
+        self.max_batch_seconds = max_batch_seconds
+        self.max_prompt_chars = max_prompt_chars
+        self._wav_buffer = io.BytesIO()  # reused upload file; chunks are encoded straight into it
 
         # Audio buffer and processing queue
-        self.audio_queue = queue.Queue()
+        self.audio_queue = queue.Queue(maxsize=max_queue_chunks)
+        self.dropped_chunks = 0
+        self.skipped_chunks = 0  # silent windows the caller chose not to submit
         self.is_processing = False
 
         # Transcript storage
-        self.full_transcript = ""
+        self._transcript_parts = []  # " " + text per chunk; joined on demand
+        self._transcript_len = 0
+        self._transcript_cache = ""
+        # Guards the three fields above: the processing thread appends while answer
+        # workers and live-update readers join and cache
+        self._transcript_lock = threading.Lock()
         self.recent_transcript = deque(maxlen=20)  # Keep last 20 chunks
         self.detected_questions = []
+        self._detected_set = set()  # normalized keys of detected_questions, for O(1) lookups
 
         # Callbacks
         self.on_transcript_update = None
@@ -153,78 +272,196 @@ class RealtimeProcessor:
         # Processing thread
         self.processing_thread = None
 
+        # Answer generation pool (created by start, shut down by stop)
+        self.max_answer_workers = max_answer_workers
+        self._answer_pool = None
+        self._answer_futures = set()  # answers submitted and not yet finished
+        self._answer_futures_lock = threading.Lock()
+
+    @property
+    def full_transcript(self):
+        """Everything transcribed so far; the joined string is cached until the next chunk."""
+        with self._transcript_lock:
+            if self._transcript_cache is None:
+                self._transcript_cache = "".join(self._transcript_parts)
+            return self._transcript_cache
+
     def start(self):
         """Start real-time processing."""
         if self.is_processing:
             return
 
         self.is_processing = True
+        self._answer_pool = ThreadPoolExecutor(max_workers=self.max_answer_workers,
+                                               thread_name_prefix="answer")
         self.processing_thread = threading.Thread(target=self._process_loop, daemon=True)
         self.processing_thread.start()
         print("Real-time processor started")
 
-    def stop(self):
-        """Stop real-time processing."""
+    def stop(self, cancel_pending=False, answer_timeout=30):
+        """
+        Stop real-time processing.
+
+        Args:
+            cancel_pending: Drop questions not yet answered (e.g. the client has
+                disconnected) instead of waiting for them
+            answer_timeout: Longest wait in seconds for pending answers; any
+                still queued after it are dropped
+        """
         self.is_processing = False
         if self.processing_thread:
             self.processing_thread.join(timeout=5)
+        if self._answer_pool:
+            if not cancel_pending:
+                self.wait_for_answers(timeout=answer_timeout)
+            # Whatever is still waiting for a worker is no longer worth answering
+            try:
+                self._answer_pool.shutdown(wait=False, cancel_futures=True)
+            except TypeError:
+                # Python 3.8 has no cancel_futures
+                self._answer_pool.shutdown(wait=False)
         print("Real-time processor stopped")
 
-    def add_audio_chunk(self, audio_data, sample_rate):
+    def drain(self, timeout=None):
+        """
+        Wait until every queued chunk has been transcribed.
+
+        Args:
+            timeout: Longest wait in seconds, or None to wait indefinitely
+
+        Returns:
+            bool: True if the queue drained, False on timeout
+        """
+        # Queue.join() with a deadline, on the queue's own task condition
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = self.audio_queue.all_tasks_done
+        with done:
+            while self.audio_queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                done.wait(remaining)
+        return True
+
+    def add_audio_chunk(self, audio_data, sample_rate, on_done=None):
         """
         Add audio chunk to processing queue.
 
         Args:
             audio_data: Audio data as numpy array
             sample_rate: Sample rate of audio
+            on_done: Optional callable invoked once audio_data is no longer needed
+                (e.g. to return a pooled buffer)
         """
-        self.audio_queue.put({
-            'audio': audio_data,
-            'sample_rate': sample_rate,
-            'timestamp': time.time()
-        })
+        chunk_data = AudioChunk(audio_data, sample_rate, time.time(), on_done)
+        while True:
+            try:
+                self.audio_queue.put_nowait(chunk_data)
+                return
+            except queue.Full:
+                pass
+
+            # Transcription is behind: drop the oldest chunk to stay close to real time
+            try:
+                stale = self.audio_queue.get_nowait()
+            except queue.Empty:
+                continue
+            self.audio_queue.task_done()
+            self.dropped_chunks += 1
+            logger.warning("[RealtimeProcessor] Transcription falling behind; dropped a queued chunk")
+            if stale.on_done:
+                stale.on_done()
 
     def _process_loop(self):
         """Main processing loop (runs in background thread)."""
-        print("[RealtimeProcessor] Processing loop started")
+        logger.debug("[RealtimeProcessor] Processing loop started")
+
+        # Bound once rather than looked up on every chunk
+        get_chunk = self.audio_queue.get
+        task_done = self.audio_queue.task_done
+        take_batch = self._take_batch
+        transcribe = self._transcribe_chunk
+        update_transcript = self._update_transcript
+        extract_questions = QuestionDetector.extract_questions
+        handle_question = self._handle_detected_question
 
         while self.is_processing:
             try:
                 # Get audio chunk from queue (with timeout)
-                chunk_data = self.audio_queue.get(timeout=1)
-                print(f"[RealtimeProcessor] Got audio chunk from queue, size: {len(chunk_data['audio'])}")
+                chunk_data = get_chunk(timeout=1)
+                logger.debug("[RealtimeProcessor] Got audio chunk from queue, size: %d", len(chunk_data.audio))
+            except queue.Empty:
+                continue
+
+            batched = 1
+            try:
+                # Transcribe chunk, together with any that queued up behind it
+                # (one request instead of several when Whisper falls behind)
+                audio, batched = take_batch(chunk_data)
 
-                # Transcribe chunk
-                print("[RealtimeProcessor] Transcribing chunk...")
-                transcript_text = self._transcribe_chunk(
-                    chunk_data['audio'],
-                    chunk_data['sample_rate']
-                )
-                print(f"[RealtimeProcessor] Transcription result: '{transcript_text[:100] if transcript_text else 'None'}...'")
+                logger.debug("[RealtimeProcessor] Transcribing %d chunk(s)...", batched)
+                transcript_text = transcribe(audio, WHISPER_SAMPLE_RATE)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[RealtimeProcessor] Transcription result: '%s...'",
+                                 transcript_text[:100] if transcript_text else 'None')
 
                 if transcript_text:
                     # Update transcript
-                    self._update_transcript(transcript_text)
+                    update_transcript(transcript_text)
 
                     # Detect questions
-                    print(f"[RealtimeProcessor] Detecting questions in: '{transcript_text[:60]}...'")
-                    questions = QuestionDetector.extract_questions(transcript_text)
-                    print(f"[RealtimeProcessor] Detected {len(questions)} questions")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[RealtimeProcessor] Detecting questions in: '%s...'", transcript_text[:60])
+                    questions = extract_questions(transcript_text)
+                    logger.debug("[RealtimeProcessor] Detected %d questions", len(questions))
 
                     for question in questions:
-                        self._handle_detected_question(question)
+                        handle_question(question)
 
-                self.audio_queue.task_done()
+            except Exception as e:
+                logger.exception("[RealtimeProcessor] Error in processing loop: %s", e)
+            finally:
+                # Counted even on errors so drain() does not wait for failed chunks
+                for _ in range(batched):
+                    task_done()
 
+        logger.debug("[RealtimeProcessor] Processing loop ended")
+
+    def _take_batch(self, chunk_data):
+        """
+        Convert chunk_data and the chunks queued behind it to one 16 kHz mono array.
+
+        Args:
+            chunk_data: Queue entry already taken from audio_queue
+
+        Returns:
+            tuple: (audio, number of queue entries consumed)
+        """
+        max_samples = int(self.max_batch_seconds * WHISPER_SAMPLE_RATE)
+        get_nowait = self.audio_queue.get_nowait
+        parts = []
+        total = 0
+        while True:
+            # Whisper works on 16 kHz mono; converting first shrinks the upload
+            on_done = chunk_data.on_done
+            try:
+                audio = downmix_resample(chunk_data.audio, chunk_data.sample_rate)
+            finally:
+                # The audio has been copied out; its buffer can be reused
+                if on_done:
+                    on_done()
+            parts.append(audio)
+            total += len(audio)
+
+            if total >= max_samples:
+                break
+            try:
+                chunk_data = get_nowait()
             except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"[RealtimeProcessor] Error in processing loop: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
+                break
 
-        print("[RealtimeProcessor] Processing loop ended")
+        audio = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        return audio, len(parts)
 
     def _transcribe_chunk(self, audio_data, sample_rate):
         """
@@ -238,12 +475,16 @@ class RealtimeProcessor:
             str: Transcribed text
         """
         try:
-            import soundfile as sf
-            import io
-
-            # Convert audio to bytes
-            buffer = io.BytesIO()
-            sf.write(buffer, audio_data, sample_rate, format='WAV')
+            # Size the reused file to this chunk and encode into its memory in place
+            buffer = self._wav_buffer
+            size = WAV_HEADER_SIZE + audio_data.size * 2
+            if buffer.seek(0, io.SEEK_END) < size:
+                buffer.seek(size - 1)
+                buffer.write(b"\0")
+            else:
+                buffer.truncate(size)
+            with buffer.getbuffer() as view:
+                encode_wav_pcm16(audio_data, sample_rate, out=view)
             buffer.seek(0)
 
             # Transcribe using Whisper API
@@ -273,7 +514,10 @@ class RealtimeProcessor:
         self.recent_transcript.append(text)
 
         # Update full transcript
-        self.full_transcript += " " + text
+        with self._transcript_lock:
+            self._transcript_parts.append(" " + text)
+            self._transcript_len += len(text) + 1
+            self._transcript_cache = None
 
         # Notify callback
         if self.on_transcript_update:
@@ -289,10 +533,13 @@ class RealtimeProcessor:
         Args:
             question: Detected question text
         """
-        # Check if we've already processed this question
-        if question in self.detected_questions:
+        # Check if we've already processed this question; the key ignores case,
+        # spacing and the question mark so re-transcriptions still match
+        key = _WHITESPACE_RE.sub(' ', question.strip().lower()).rstrip('?')
+        if key in self._detected_set:
             return
 
+        self._detected_set.add(key)
         self.detected_questions.append(question)
         print(f"Question detected: {question}")
 
@@ -304,12 +551,48 @@ class RealtimeProcessor:
                 print(f"Error in question callback: {e}")
 
         # Generate answer in background
-        answer_thread = threading.Thread(
-            target=self._generate_answer,
-            args=(question,),
-            daemon=True
-        )
-        answer_thread.start()
+        try:
+            future = self._answer_pool.submit(self._generate_answer, question)
+        except RuntimeError:
+            # stop() has shut the pool down
+            logger.debug("[RealtimeProcessor] Not answering after stop: %s", question)
+            return
+        with self._answer_futures_lock:
+            self._answer_futures.add(future)
+        future.add_done_callback(self._answer_finished)
+
+    def _answer_finished(self, future):
+        with self._answer_futures_lock:
+            self._answer_futures.discard(future)
+
+    def wait_for_answers(self, timeout=None):
+        """
+        Wait until every answer requested so far has been generated.
+
+        Args:
+            timeout: Longest wait in seconds, or None to wait indefinitely
+
+        Returns:
+            bool: True if all answers finished, False on timeout
+        """
+        with self._answer_futures_lock:
+            pending = list(self._answer_futures)
+        _, not_done = futures_wait(pending, timeout=timeout)
+        return not not_done
+
+    def _transcript_tail(self, max_chars):
+        """Last max_chars characters of the transcript, joined from the newest parts only."""
+        with self._transcript_lock:
+            if self._transcript_len > max_chars:
+                parts = []
+                total = 0
+                for part in reversed(self._transcript_parts):
+                    parts.append(part)
+                    total += len(part)
+                    if total >= max_chars:
+                        break
+                return "".join(reversed(parts))[-max_chars:]
+        return self.full_transcript
 
     def _generate_answer(self, question):
         """
@@ -322,8 +605,12 @@ class RealtimeProcessor:
             # Get recent context (last few transcript chunks)
             context = " ".join(list(self.recent_transcript)[-5:])
 
-            # Use full transcript if available, otherwise use recent context
-            transcript_to_use = self.full_transcript if len(self.full_transcript) > 100 else context
+            # Use the transcript so far (its latest max_prompt_chars) if available,
+            # otherwise use recent context
+            if self._transcript_len > 100:
+                transcript_to_use = self._transcript_tail(self.max_prompt_chars)
+            else:
+                transcript_to_use = context
 
             # Generate quick answer (optimized for speed)
             start_time = time.time()
@@ -352,7 +639,9 @@ class RealtimeProcessor:
             dict: Statistics about processing
         """
         return {
-            'total_transcript_length': len(self.full_transcript),
+            'total_transcript_length': self._transcript_len,
+            'dropped_chunks': self.dropped_chunks,
+            'skipped_chunks': self.skipped_chunks,
             'chunks_processed': len(self.recent_transcript),
             'questions_detected': len(self.detected_questions),
             'queue_size': self.audio_queue.qsize()
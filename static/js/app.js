@@ -109,20 +109,19 @@ function initializeSocket() {
         showMessage(`Quick answer generated in ${data.time_ms}ms`, 'success');
     });
 
-    // Live mode event handlers
-    socket.on('live_transcript', function(data) {
-        console.log('Live transcript update:', data);
-        updateLiveTranscript(data.chunk, data.full);
-    });
-
-    socket.on('question_detected', function(data) {
-        console.log('Question detected:', data);
-        displayDetectedQuestion(data.question);
-    });
-
-    socket.on('live_answer', function(data) {
-        console.log('Live answer ready:', data);
-        displayLiveAnswer(data.question, data.answer, data.time_ms);
+    // Live mode event handlers: the server batches transcripts, questions and
+    // answers into one live_update event
+    socket.on('live_update', function(data) {
+        console.log('Live update:', data);
+        data.transcripts.forEach(function(t) {
+            updateLiveTranscript(t.chunk, t.full);
+        });
+        data.questions.forEach(function(q) {
+            displayDetectedQuestion(q.question);
+        });
+        data.answers.forEach(function(a) {
+            displayLiveAnswer(a.question, a.answer, a.time_ms);
+        });
     });
 
     socket.on('live_session_complete', function(data) {
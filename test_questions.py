@@ -2,6 +2,10 @@
 Test script to validate question detection for common interview questions.
 Run this to verify the question detector is working properly.
 """
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from realtime_processor import QuestionDetector
 
@@ -53,58 +57,69 @@ TEST_QUESTIONS = {
     ]
 }
 
+# (category, question) pairs in report order, flattened once at import
+_FLAT = tuple((category, question) for category, questions in TEST_QUESTIONS.items()
+              for question in questions)
+
+
 def test_question_detection():
     """Test the question detector against all common interview questions."""
+    # The report is assembled in memory and written to stdout in one go
+    buf = io.StringIO()
 
-    print("=" * 80)
-    print("QUESTION DETECTION TEST")
-    print("=" * 80)
-    print()
+    print("=" * 80, file=buf)
+    print("QUESTION DETECTION TEST", file=buf)
+    print("=" * 80, file=buf)
+    print(file=buf)
 
-    total_questions = 0
-    detected_questions = 0
-    failed_questions = []
+    # Classify every question up front across a pool into a pass/fail mask
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        mask = bytearray(executor.map(QuestionDetector.is_question, (q for _, q in _FLAT)))
 
-    for category, questions in TEST_QUESTIONS.items():
-        print(f"\n📋 {category}")
-        print("-" * 80)
+    current_category = None
+    for (category, question), is_detected in zip(_FLAT, mask):
+        if category != current_category:
+            current_category = category
+            print(f"\n📋 {category}", file=buf)
+            print("-" * 80, file=buf)
 
-        for question in questions:
-            total_questions += 1
-            is_detected = QuestionDetector.is_question(question)
+        short = question[:70]
+        if is_detected:
+            print(f"✅ {short}...", file=buf)
+        else:
+            print(f"❌ {short}...", file=buf)
 
-            if is_detected:
-                detected_questions += 1
-                print(f"✅ {question[:70]}...")
-            else:
-                print(f"❌ {question[:70]}...")
-                failed_questions.append((category, question))
+    total_questions = len(_FLAT)
+    detected_questions = mask.count(1)
+    failed_questions = [pair for pair, is_detected in zip(_FLAT, mask) if not is_detected]
 
     # Summary
-    print("\n" + "=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-    print(f"Total Questions: {total_questions}")
-    print(f"Detected: {detected_questions}")
-    print(f"Missed: {len(failed_questions)}")
-    print(f"Success Rate: {(detected_questions/total_questions)*100:.1f}%")
+    print("\n" + "=" * 80, file=buf)
+    print("SUMMARY", file=buf)
+    print("=" * 80, file=buf)
+    print(f"Total Questions: {total_questions}", file=buf)
+    print(f"Detected: {detected_questions}", file=buf)
+    print(f"Missed: {len(failed_questions)}", file=buf)
+    print(f"Success Rate: {(detected_questions/total_questions)*100:.1f}%", file=buf)
 
     if failed_questions:
-        print("\n" + "=" * 80)
-        print("MISSED QUESTIONS")
-        print("=" * 80)
+        print("\n" + "=" * 80, file=buf)
+        print("MISSED QUESTIONS", file=buf)
+        print("=" * 80, file=buf)
         for category, question in failed_questions:
-            print(f"\n[{category}]")
-            print(f"  {question}")
+            print(f"\n[{category}]", file=buf)
+            print(f"  {question}", file=buf)
 
-    print("\n" + "=" * 80)
+    print("\n" + "=" * 80, file=buf)
 
     if detected_questions == total_questions:
-        print("🎉 ALL QUESTIONS DETECTED SUCCESSFULLY!")
+        print("🎉 ALL QUESTIONS DETECTED SUCCESSFULLY!", file=buf)
     else:
-        print(f"⚠️  {len(failed_questions)} questions need attention")
+        print(f"⚠️  {len(failed_questions)} questions need attention", file=buf)
+
+    print("=" * 80, file=buf)
 
-    print("=" * 80)
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
@@ -1,56 +1,178 @@
 """
 Speech-to-text transcription module using OpenAI Whisper API.
 """
+import asyncio
+import hashlib
 import os
-from openai import OpenAI
+import pathlib
+import shutil
+import subprocess
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from datetime import datetime
 
+import numpy as np
+import soundfile as sf
+
+from audio_dsp import downmix_resample, encode_wav_pcm16, strip_silence, WHISPER_SAMPLE_RATE
+
+# Long recordings are split into segments of about this length and transcribed
+# concurrently; 30 s matches the window Whisper decodes internally
+SEGMENT_SECONDS = 30
+# Each cut is moved to the quietest point in the last few seconds of its segment,
+# so words are not split between requests
+SEGMENT_SEARCH_SECONDS = 3
+SEGMENT_WORKERS = 4
+
+# Whisper model for regular and timestamped requests; the model is part of the cache key
+_TRANSCRIBE_MODEL = "whisper-1"
+# Model for streaming transcription; whisper-1 only returns the finished text
+_STREAMING_MODEL = "gpt-4o-transcribe"
+
+# Connection pool for Transcribers without a shared http_client: HTTP/2 lets
+# concurrent segment uploads share one connection, and idle connections are kept
+# for a minute (httpx drops them after 5 s), so back-to-back files skip the
+# TCP+TLS handshake. The long read timeout leaves room for large uploads.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# Metadata header of a saved transcript; the static text is encoded once, so
+# only the file name, timestamp and transcript are encoded per save
+_HEADER_PREFIX = b"Transcript for: "
+_HEADER_GENERATED = b"\nGenerated: "
+_HEADER_END = b"\n" + b"-" * 80 + b"\n\n"
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_path():
+    """Locate ffmpeg once; warn if speed-up was requested but it is missing."""
+    path = shutil.which("ffmpeg")
+    if not path:
+        print("WARNING: ffmpeg not found; uploading audio at normal speed.")
+    return path
+
+
+def _speed_up(source, speedup):
+    """
+    Time-compress audio with ffmpeg's pitch-preserving atempo filter.
+
+    Args:
+        source: WAV bytes, or a path to any audio file ffmpeg can decode
+        speedup: Playback rate between 1.0 and 2.0
+
+    Returns:
+        bytes: The sped-up audio as WAV, or None if ffmpeg is not installed
+    """
+    ffmpeg = _ffmpeg_path()
+    if not ffmpeg:
+        return None
+
+    from_pipe = isinstance(source, (bytes, bytearray))
+    cmd = [ffmpeg, "-loglevel", "error", "-i", "pipe:0" if from_pipe else source,
+           "-filter:a", f"atempo={speedup}", "-vn", "-f", "wav", "pipe:1"]
+    try:
+        return subprocess.run(cmd, input=source if from_pipe else None,
+                              stdout=subprocess.PIPE, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        # Only stat the input once ffmpeg has failed, to report a missing file clearly
+        if not from_pipe and not os.path.exists(source):
+            raise FileNotFoundError(f"Audio file not found: {source}") from e
+        raise
+
+
+def _open_audio(path):
+    """Open an audio file for reading; a missing file raises FileNotFoundError naming it."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Audio file not found: {path}") from e
+    if hasattr(os, "posix_fadvise"):
+        # Audio is hashed and uploaded front to back; a sequential hint makes
+        # the kernel read ahead further on long recordings
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return f
+
 
 class Transcriber:
     """Transcribes audio files to text using OpenAI Whisper API."""
 
-    def __init__(self, api_key=None, output_dir="transcripts"):
+    def __init__(self, api_key=None, output_dir="transcripts", http_client=None, use_cache=True,
+                 streaming=False):
         """
         Initialize the transcriber.
 
         Args:
             api_key: OpenAI API key. If None, reads from environment variable.
             output_dir: Directory to save transcripts
+            http_client: Optional httpx.Client to share connections with other API
+                clients; by default the transcriber keeps its own pool
+            use_cache: Reuse transcripts of identical audio from memory and
+                <output_dir>/cache instead of calling Whisper again
+            streaming: Transcribe with gpt-4o-transcribe through stream_transcribe,
+                which yields text while each segment is still being decoded
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key not provided and not found in environment")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+        self.client = OpenAI(api_key=self.api_key, http_client=http_client)
+        # Async clients are bound to the event loop that created them
+        self._aclients = weakref.WeakKeyDictionary()
         self.output_dir = output_dir
+        self.use_cache = use_cache
+        self.streaming = streaming
+        self.model = _STREAMING_MODEL if streaming else _TRANSCRIBE_MODEL
+        # Most recently used transcripts in memory; older ones stay on disk
+        self.cache_size = 256
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_dir = os.path.join(output_dir, "cache")
 
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
 
-    def transcribe_audio(self, audio_file_path, save_transcript=True):
+    def transcribe_audio(self, audio_file_path, save_transcript=True, speedup=1.0):
         """
         Transcribe an audio file to text.
 
         Args:
             audio_file_path: Path to the audio file
             save_transcript: Whether to save the transcript to a file
+            speedup: Play audio this much faster before upload (1.0-2.0, needs
+                ffmpeg); fewer billed minutes and faster results, at some cost
+                in accuracy on fast or unclear speech
 
         Returns:
             dict: Contains 'text' (transcript) and 'file_path' (if saved)
         """
-        if not os.path.exists(audio_file_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+        if not 1.0 <= speedup <= 2.0:
+            raise ValueError(f"speedup must be between 1.0 and 2.0, got {speedup}")
 
         print(f"Transcribing audio file: {audio_file_path}")
         print("This may take a moment...")
 
         try:
-            with open(audio_file_path, "rb") as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="text"
-                )
+            key = self._cache_key(audio_file_path, speedup) if self.use_cache else None
+            transcript = self._cache_get(key) if key else None
+
+            if transcript is not None:
+                print("Using cached transcript for identical audio.")
+            else:
+                transcript = self._transcribe_file(audio_file_path, speedup)
+                if key:
+                    self._cache_put(key, transcript)
 
             print("Transcription completed!")
 
@@ -67,37 +189,424 @@ class Transcriber:
             print(f"Error during transcription: {e}")
             raise
 
-    def transcribe_with_timestamps(self, audio_file_path, save_transcript=True):
+    async def atranscribe_audio(self, audio_file_path, save_transcript=True, speedup=1.0):
+        """
+        Async variant of transcribe_audio for callers running an event loop.
+
+        Requests go through one AsyncOpenAI client per event loop, so its
+        keep-alive connections are reused by every call made on that loop.
+
+        Args:
+            audio_file_path: Path to the audio file
+            save_transcript: Whether to save the transcript to a file
+            speedup: Play audio this much faster before upload (1.0-2.0, needs ffmpeg)
+
+        Returns:
+            dict: Contains 'text' (transcript) and 'file_path' (if saved)
+        """
+        if not 1.0 <= speedup <= 2.0:
+            raise ValueError(f"speedup must be between 1.0 and 2.0, got {speedup}")
+
+        print(f"Transcribing audio file: {audio_file_path}")
+        print("This may take a moment...")
+
+        loop = asyncio.get_running_loop()
+        try:
+            key = await loop.run_in_executor(None, self._cache_key, audio_file_path, speedup) \
+                if self.use_cache else None
+            transcript = self._cache_get(key) if key else None
+
+            if transcript is not None:
+                print("Using cached transcript for identical audio.")
+            else:
+                transcript = await self._atranscribe_file(audio_file_path, speedup)
+                if key:
+                    self._cache_put(key, transcript)
+
+            print("Transcription completed!")
+
+            result = {"text": transcript}
+
+            # Save transcript if requested
+            if save_transcript:
+                transcript_path = self._save_transcript(transcript, audio_file_path)
+                result["file_path"] = transcript_path
+
+            return result
+
+        except Exception as e:
+            print(f"Error during transcription: {e}")
+            raise
+
+    async def _atranscribe_file(self, audio_file_path, speedup):
+        """_transcribe_file on the async client; file reads and encoding run in the executor."""
+        loop = asyncio.get_running_loop()
+        if self.streaming:
+            return await loop.run_in_executor(None, self._transcribe_file, audio_file_path, speedup)
+
+        aclient = self._get_aclient()
+        bounds = await loop.run_in_executor(None, self._segment_bounds, audio_file_path)
+        if not bounds:
+            fast = await loop.run_in_executor(None, _speed_up, audio_file_path, speedup) \
+                if speedup != 1.0 else None
+            # Given a path, the SDK reads the file in a worker thread; an open file
+            # would be read synchronously on the event loop while uploading
+            return await aclient.audio.transcriptions.create(
+                model=self.model,
+                file=pathlib.Path(audio_file_path) if fast is None else ("audio.wav", fast, "audio/wav"),
+                response_format="text"
+            )
+
+        limit = asyncio.Semaphore(SEGMENT_WORKERS)
+
+        async def transcribe_segment(bound):
+            async with limit:
+                data = await loop.run_in_executor(None, self._segment_upload, audio_file_path, bound, speedup)
+                if data is None:
+                    return ""
+                text = await aclient.audio.transcriptions.create(
+                    model=self.model,
+                    file=("segment.wav", data, "audio/wav"),
+                    response_format="text"
+                )
+                return text.strip()
+
+        if len(bounds) > 1:
+            print(f"Transcribing {len(bounds)} segments concurrently...")
+        texts = await asyncio.gather(*(transcribe_segment(bound) for bound in bounds))
+        return " ".join(text for text in texts if text)
+
+    def _get_aclient(self):
+        """Return the AsyncOpenAI client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        aclient = self._aclients.get(loop)
+        if aclient is None:
+            aclient = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+            )
+            self._aclients[loop] = aclient
+        return aclient
+
+    def close(self):
+        """Close the connection pool, unless it was passed in and is shared."""
+        if self._owns_http_client:
+            self.client.close()
+
+    async def aclose(self):
+        """Close the async client of the running event loop, if one was created."""
+        aclient = self._aclients.pop(asyncio.get_running_loop(), None)
+        if aclient is not None:
+            await aclient.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # Only the loop-bound async client is closed; the instance stays usable
+        # and opens a new one in the next event loop
+        await self.aclose()
+
+    def stream_transcribe(self, audio_file_path, speedup=1.0):
+        """
+        Transcribe an audio file, yielding text as the API produces it.
+
+        Segments are streamed one after another so the text arrives in order;
+        joining everything yielded gives the full transcript.
+
+        Args:
+            audio_file_path: Path to the audio file
+            speedup: Play audio this much faster before upload (1.0-2.0, needs ffmpeg)
+
+        Yields:
+            str: Transcript deltas, with a space between segments
+        """
+        if not 1.0 <= speedup <= 2.0:
+            raise ValueError(f"speedup must be between 1.0 and 2.0, got {speedup}")
+
+        bounds = self._segment_bounds(audio_file_path)
+        if not bounds:
+            fast = _speed_up(audio_file_path, speedup) if speedup != 1.0 else None
+            with _open_audio(audio_file_path) as audio_file:
+                yield from self._stream_deltas(audio_file if fast is None else ("audio.wav", fast, "audio/wav"))
+            return
+
+        separator = ""
+        for bound in bounds:
+            data = self._segment_upload(audio_file_path, bound, speedup)
+            if data is None:
+                continue
+            started = False
+            for delta in self._stream_deltas(("segment.wav", data, "audio/wav")):
+                if not started:
+                    # Match the non-streaming join: segments stripped, one space between
+                    delta = delta.lstrip()
+                    if not delta:
+                        continue
+                    if separator:
+                        yield separator
+                    started = True
+                yield delta
+            if started:
+                separator = " "
+
+    def _stream_deltas(self, file):
+        """Yield the text deltas of one streaming transcription request."""
+        stream = self.client.audio.transcriptions.create(
+            model=_STREAMING_MODEL,
+            file=file,
+            response_format="text",
+            stream=True
+        )
+        for event in stream:
+            if event.type == "transcript.text.delta":
+                yield event.delta
+
+    def _transcribe_file(self, audio_file_path, speedup):
+        """Send one file to Whisper, in segments where soundfile can read it."""
+        if self.streaming:
+            return "".join(self.stream_transcribe(audio_file_path, speedup))
+
+        bounds = self._segment_bounds(audio_file_path)
+        if bounds:
+            return self._transcribe_segments(audio_file_path, bounds, speedup)
+
+        fast = _speed_up(audio_file_path, speedup) if speedup != 1.0 else None
+        with _open_audio(audio_file_path) as audio_file:
+            return self.client.audio.transcriptions.create(
+                model=self.model,
+                file=audio_file if fast is None else ("audio.wav", fast, "audio/wav"),
+                response_format="text"
+            )
+
+    def _cache_key(self, audio_file_path, speedup):
+        """BLAKE2b of the audio content plus the settings that shape the transcript."""
+        digest = hashlib.blake2b(digest_size=16)
+        with _open_audio(audio_file_path) as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(f"|{self.model}|text|{speedup}".encode())
+        return digest.hexdigest()
+
+    def _cache_get(self, key):
+        """Cached transcript for key from memory, then disk; None on a miss."""
+        with self._cache_lock:
+            transcript = self._cache.get(key)
+            if transcript is not None:
+                self._cache.move_to_end(key)
+                return transcript
+
+        try:
+            with open(os.path.join(self._cache_dir, f"{key}.txt"), "rb") as f:
+                transcript = f.read().decode("utf-8")
+        except OSError:
+            return None
+        self._cache_remember(key, transcript)
+        return transcript
+
+    def _cache_put(self, key, transcript):
+        """Store a transcript in memory and on disk."""
+        self._cache_remember(key, transcript)
+        os.makedirs(self._cache_dir, exist_ok=True)
+        # Write a temporary file and rename it into place, so a crash or a
+        # concurrent writer never leaves a truncated entry behind
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(transcript.encode("utf-8"))
+            os.replace(tmp_path, os.path.join(self._cache_dir, f"{key}.txt"))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _cache_remember(self, key, transcript):
+        """Add a transcript to the in-memory LRU, evicting the oldest beyond cache_size."""
+        with self._cache_lock:
+            self._cache[key] = transcript
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def transcribe_many(self, audio_file_paths, save_transcript=True, max_concurrency=8, speedup=1.0):
+        """
+        Transcribe several audio files concurrently.
+
+        Largest files start first so short ones fill in around them.
+
+        Args:
+            audio_file_paths: Paths to the audio files
+            save_transcript: Whether to save each transcript to a file
+            max_concurrency: Files transcribed at the same time
+            speedup: Passed to transcribe_audio
+
+        Returns:
+            list: One transcribe_audio result dict per path, in input order; a
+            file that failed gets {'error': message} instead
+        """
+        def transcribe_one(path):
+            try:
+                return self.transcribe_audio(path, save_transcript=save_transcript, speedup=speedup)
+            except Exception as e:
+                return {"error": str(e)}
+
+        def size(path):
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+
+        order = sorted(range(len(audio_file_paths)), key=lambda i: size(audio_file_paths[i]), reverse=True)
+        results = [None] * len(audio_file_paths)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {i: executor.submit(transcribe_one, audio_file_paths[i]) for i in order}
+            for i, future in futures.items():
+                results[i] = future.result()
+        return results
+
+    def _segment_bounds(self, audio_file_path):
+        """
+        Split a recording into (start, end) frame ranges of about SEGMENT_SECONDS.
+
+        Args:
+            audio_file_path: Path to the audio file
+
+        Returns:
+            list: Frame ranges in order (one for short recordings), or None for
+            formats soundfile cannot read; those are uploaded as they are
+        """
+        try:
+            f = sf.SoundFile(audio_file_path)
+        except Exception:
+            return None
+
+        with f:
+            sr, total = f.samplerate, f.frames
+            segment = SEGMENT_SECONDS * sr
+            search = SEGMENT_SEARCH_SECONDS * sr
+            hop = sr // 10  # compare loudness in 100 ms steps
+
+            bounds = []
+            start = 0
+            while total - start > segment:
+                # Cut at the quietest 100 ms in the last few seconds of the segment
+                window_start = start + segment - search
+                f.seek(window_start)
+                window = f.read(search, dtype='float32', always_2d=True)
+                steps = len(window) // hop
+                energy = np.square(window[:steps * hop]).reshape(steps, -1).sum(axis=1)
+                cut = window_start + int(np.argmin(energy)) * hop
+                bounds.append((start, cut))
+                start = cut
+            bounds.append((start, total))
+        return bounds
+
+    def _transcribe_segments(self, audio_file_path, bounds, speedup=1.0):
+        """
+        Transcribe frame ranges of a recording concurrently and join them in order.
+
+        Args:
+            audio_file_path: Path to the audio file
+            bounds: (start, end) frame ranges from _segment_bounds
+            speedup: Playback rate applied to each segment before upload
+
+        Returns:
+            str: The combined transcript
+        """
+        def transcribe_segment(bound):
+            data = self._segment_upload(audio_file_path, bound, speedup)
+            if data is None:
+                return ""
+            return self.client.audio.transcriptions.create(
+                model=self.model,
+                file=("segment.wav", data, "audio/wav"),
+                response_format="text"
+            ).strip()
+
+        if len(bounds) > 1:
+            print(f"Transcribing {len(bounds)} segments concurrently...")
+        with ThreadPoolExecutor(max_workers=SEGMENT_WORKERS) as executor:
+            texts = list(executor.map(transcribe_segment, bounds))
+        return " ".join(text for text in texts if text)
+
+    def _segment_upload(self, audio_file_path, bound, speedup=1.0):
+        """
+        Read one frame range of a recording and encode it for upload.
+
+        Args:
+            audio_file_path: Path to the audio file
+            bound: (start, end) frame range from _segment_bounds
+            speedup: Playback rate applied before upload
+
+        Returns:
+            bytes: 16 kHz mono WAV data, or None if the range is all silence
+        """
+        start, end = bound
+        # SoundFile handles are not thread-safe; each caller opens its own
+        with sf.SoundFile(audio_file_path) as f:
+            f.seek(start)
+            audio = f.read(end - start, dtype='float32')
+            sr = f.samplerate
+
+        # Long pauses cost upload time and billed minutes but carry no words
+        audio = strip_silence(audio, sr)
+        if not len(audio):
+            return None
+        # Whisper works on 16 kHz mono; converting here uploads up to 6x fewer bytes
+        audio = downmix_resample(audio, sr)
+        data = bytes(encode_wav_pcm16(audio, WHISPER_SAMPLE_RATE))
+        if speedup != 1.0:
+            data = _speed_up(data, speedup) or data
+        return data
+
+    def transcribe_with_timestamps(self, audio_file_path, save_transcript=True, speedup=1.0,
+                                   need_segments=True):
         """
         Transcribe an audio file with word-level timestamps.
 
         Args:
             audio_file_path: Path to the audio file
             save_transcript: Whether to save the transcript to a file
+            speedup: Play audio this much faster before upload (1.0-2.0, needs
+                ffmpeg); timestamps are scaled back to the original recording
+            need_segments: If False, skip the much larger verbose_json response and
+                transcribe as plain text (cached, segmented); 'segments' is then empty
 
         Returns:
             dict: Contains 'text', 'segments', and optionally 'file_path'
         """
-        if not os.path.exists(audio_file_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+        if not need_segments:
+            result = self.transcribe_audio(audio_file_path, save_transcript=save_transcript, speedup=speedup)
+            result["segments"] = []
+            return result
+
+        if not 1.0 <= speedup <= 2.0:
+            raise ValueError(f"speedup must be between 1.0 and 2.0, got {speedup}")
 
         print(f"Transcribing audio file with timestamps: {audio_file_path}")
         print("This may take a moment...")
 
         try:
-            with open(audio_file_path, "rb") as audio_file:
+            fast = _speed_up(audio_file_path, speedup) if speedup != 1.0 else None
+            with _open_audio(audio_file_path) as audio_file:
                 transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
+                    model=_TRANSCRIBE_MODEL,
+                    file=audio_file if fast is None else ("audio.wav", fast, "audio/wav"),
                     response_format="verbose_json",
                     timestamp_granularities=["segment"]
                 )
 
             print("Transcription completed!")
 
+            segments = transcript.segments if hasattr(transcript, 'segments') else []
+            if fast is not None:
+                # Map times in the sped-up audio back onto the original recording
+                for segment in segments or []:
+                    segment.start *= speedup
+                    segment.end *= speedup
+
             result = {
                 "text": transcript.text,
-                "segments": transcript.segments if hasattr(transcript, 'segments') else []
+                "segments": segments
             }
 
             # Save transcript if requested
@@ -129,11 +638,13 @@ class Transcriber:
         transcript_path = os.path.join(self.output_dir, transcript_filename)
 
         # Save transcript with metadata
-        with open(transcript_path, "w", encoding="utf-8") as f:
-            f.write(f"Transcript for: {audio_filename}\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("-" * 80 + "\n\n")
-            f.write(transcript_text)
+        data = b"".join((
+            _HEADER_PREFIX, audio_filename.encode("utf-8"),
+            _HEADER_GENERATED, datetime.now().strftime('%Y-%m-%d %H:%M:%S').encode("ascii"),
+            _HEADER_END, transcript_text.encode("utf-8")
+        ))
+        with open(transcript_path, "wb") as f:
+            f.write(data)
 
         print(f"Transcript saved to: {transcript_path}")
         return transcript_path
@@ -149,10 +660,35 @@ class Transcriber:
             str: The transcript text
         """
         with open(transcript_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Skip metadata lines (first 3 lines)
-        lines = content.split("\n")
-        if len(lines) > 3 and lines[2].startswith("-" * 20):
-            return "\n".join(lines[4:])
-        return content
+            # Skip metadata lines (first 3 lines) and the blank line after them;
+            # only the header is inspected, the body is read once as-is
+            l1, l2, l3 = f.readline(), f.readline(), f.readline()
+            if l3.startswith("-" * 20) and l3.endswith("\n"):
+                f.readline()
+                return f.read()
+            return l1 + l2 + l3 + f.read()
+
+
+_TRANSCRIBERS = {}
+_TRANSCRIBERS_LOCK = threading.Lock()
+
+
+def get_transcriber(**kwargs):
+    """
+    Return the process-wide Transcriber for the given options, creating it on first use.
+
+    Reusing one instance keeps its OpenAI clients, connection pool and
+    transcript cache warm, so only the first call pays the setup cost.
+
+    Args:
+        **kwargs: Transcriber constructor arguments
+
+    Returns:
+        Transcriber: Shared transcriber instance
+    """
+    key = tuple(sorted(kwargs.items()))
+    with _TRANSCRIBERS_LOCK:
+        transcriber = _TRANSCRIBERS.get(key)
+        if transcriber is None:
+            transcriber = _TRANSCRIBERS[key] = Transcriber(**kwargs)
+        return transcriber